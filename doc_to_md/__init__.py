@@ -1,5 +1,8 @@
 """Doc-to-MD: PDF to Markdown conversion for RAG applications."""
 
+# Set before the submodules are imported, the pipeline puts it in cache keys
+__version__ = "0.1.0"
+
 from .pipeline import DocToMd, ConversionPipeline, PipelineConfig, quick_convert
 from .processing import (
     Chunk,
@@ -7,14 +10,13 @@ from .processing import (
     ConversionResult,
     DocumentMetadata,
     PDFConverterBase,
+    PdfiumConverter,
     PyMuPDFConverter,
     Section,
     TableData,
     TOCItem,
 )
 
-__version__ = "0.1.0"
-
 __all__ = [
     # Pipeline
     "DocToMd",
@@ -32,4 +34,5 @@ __all__ = [
     # Converters
     "PDFConverterBase",
     "PyMuPDFConverter",
+    "PdfiumConverter",
 ]
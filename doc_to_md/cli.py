@@ -1,16 +1,29 @@
 """Command-line interface for doc-to-md converter."""
 
 import argparse
+import itertools
+import json
 import logging
+import os
 import sys
+import time
 from pathlib import Path
+from typing import Optional
 
-from .pipeline import DocToMd, ConversionPipeline, PipelineConfig
+from .pipeline import DocToMd, find_inputs
 from .post_processing import SegmenterConfig
 
+try:
+    from tqdm import tqdm
+except ImportError:  # tqdm is optional, progress is only logged
+    tqdm = None
+
 
 logger = logging.getLogger(__name__)
 
+# Values accepted by --backend and $DOCTOMD_BACKEND
+BACKENDS = ('pymupdf', 'pdfium')
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging."""
@@ -22,29 +35,49 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+def _existing_file(value: str) -> Path:
+    """Argparse type for an input file that must exist."""
+    path = Path(value).expanduser()
+    if not path.is_file():
+        raise argparse.ArgumentTypeError(f"File not found: {path}")
+    return path
+
+
+def _existing_dir(value: str) -> Path:
+    """Argparse type for an input directory that must exist."""
+    path = Path(value).expanduser()
+    if not path.is_dir():
+        raise argparse.ArgumentTypeError(f"Directory not found: {path}")
+    return path
+
+
+def _non_negative_int(value: str) -> int:
+    """Argparse type for a count that may be zero but not negative."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Not a whole number: {value}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"Must not be negative: {number}")
+    return number
+
+
 def cmd_convert(args: argparse.Namespace) -> int:
     """Handle the convert command."""
-    pdf_path = Path(args.input)
-    
-    if not pdf_path.exists():
-        logger.error(f"Error: File not found: {pdf_path}")
-        return 1
+    pdf_path = args.input
     
     # Determine output path
-    if args.output:
-        output_path = Path(args.output)
-    else:
-        output_path = pdf_path.with_suffix('.md')
-    
-    # Configure pipeline using simplified API
-    pipeline = DocToMd(
-        chunk_size=args.chunk_size,
-        max_chunk_size=args.max_chunk_size,
-        output_format=args.format,
-        include_frontmatter=not args.no_frontmatter,
-    )
+    output_path = args.output or pdf_path.with_suffix('.md')
     
     try:
+        # Configure pipeline using simplified API
+        pipeline = DocToMd(
+            converter=args.backend,
+            chunk_size=args.chunk_size,
+            max_chunk_size=args.max_chunk_size,
+            output_format=args.format,
+            include_frontmatter=not args.no_frontmatter,
+        )
         result_path = pipeline.run(pdf_path, output_path)
         logger.info(f"[OK] Converted: {pdf_path.name} -> {result_path.name}")
         return 0
@@ -58,22 +91,21 @@ def cmd_convert(args: argparse.Namespace) -> int:
 
 def cmd_batch(args: argparse.Namespace) -> int:
     """Handle the batch command for directory processing."""
-    input_dir = Path(args.input_dir)
-    output_dir = Path(args.output_dir) if args.output_dir else input_dir / "converted"
-    
-    if not input_dir.exists():
-        logger.error(f"Error: Directory not found: {input_dir}")
-        return 1
+    input_dir = args.input_dir
+    output_dir = args.output_dir or input_dir / "converted"
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Configure pipeline using simplified API
     pipeline = DocToMd(
+        converter=args.backend,
         output_format=args.format,
         include_frontmatter=not args.no_frontmatter,
+        cache_dir=args.cache_dir,
     )
     
-    pdf_files = list(input_dir.glob("*.pdf"))
+    inputs = find_inputs(input_dir, recursive=args.recursive)
+    pdf_files = [path for path, _ in inputs]
     if not pdf_files:
         logger.error(f"No PDF files found in {input_dir}")
         return 0
@@ -81,29 +113,63 @@ def cmd_batch(args: argparse.Namespace) -> int:
     logger.info(f"Found {len(pdf_files)} PDF files")
     
     success_count = 0
-    for pdf_file in pdf_files:
-        try:
-            result_path = pipeline.run(pdf_file, output_dir / pdf_file.stem)
-            logger.info(f"[OK] {pdf_file.name}")
+    failures = []
+    start_time = time.perf_counter()
+    progress = tqdm(total=len(pdf_files), unit="pdf") if tqdm is not None else None
+    
+    def report(pdf_file: Path, error: Optional[Exception]) -> None:
+        nonlocal success_count
+        if error is None:
             success_count += 1
-        except Exception as e:
-            logger.error(f"[FAIL] {pdf_file.name}: {e}")
+            done = success_count + len(failures)
+            logger.info("[OK] %s (%d/%d)", pdf_file.name, done, len(pdf_files))
+        else:
+            logger.error("[FAIL] %s: %s", pdf_file.name, error)
+            failures.append({"file": str(pdf_file), "error": str(error)})
+        
+        if progress is not None:
+            progress.update(1)
+            progress.set_postfix(ok=success_count, fail=len(failures))
+    
+    # Conversions are independent and CPU-bound, so run them in separate
+    # processes (PyMuPDF is not thread-safe); -w 1 converts in this process
+    pipeline.convert_directory(
+        input_dir,
+        output_dir,
+        max_workers=args.workers or None,
+        parallel=True,
+        recursive=args.recursive,
+        on_file_done=report,
+        inputs=inputs,
+    )
+    
+    if progress is not None:
+        progress.close()
+    
+    duration = time.perf_counter() - start_time
+    logger.info(f"\nConverted {success_count}/{len(pdf_files)} files in {duration:.1f}s")
+    
+    if args.json_summary:
+        summary = {
+            "total": len(pdf_files),
+            "successful": success_count,
+            "failed": len(failures),
+            "total_duration_ms": round(duration * 1000),
+            "throughput_docs_per_sec": round(len(pdf_files) / duration, 3) if duration else None,
+            "failures": failures,
+        }
+        with open(args.json_summary, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        logger.info(f"Summary saved to {args.json_summary}")
     
-    logger.info(f"\nConverted {success_count}/{len(pdf_files)} files")
     return 0 if success_count == len(pdf_files) else 1
 
 
 def cmd_info(args: argparse.Namespace) -> int:
     """Handle the info command to show PDF metadata."""
-    from .processing import PyMuPDFConverter
+    pdf_path = args.input
     
-    pdf_path = Path(args.input)
-    
-    if not pdf_path.exists():
-        logger.error(f"Error: File not found: {pdf_path}")
-        return 1
-    
-    converter = PyMuPDFConverter()
+    converter = DocToMd(converter=args.backend).converter
     
     # Get metadata
     metadata = converter.get_metadata(pdf_path)
@@ -121,11 +187,12 @@ def cmd_info(args: argparse.Namespace) -> int:
     if toc:
         logger.info(f"\n[TOC] Table of Contents ({len(toc)} items)")
         logger.info("-" * 50)
-        for item in toc[:20]:  # Show first 20
-            indent = "  " * (item.level - 1)
-            logger.info(f"{indent}{item.title} (p.{item.page_number})")
-        if len(toc) > 20:
-            logger.info(f"  ... and {len(toc) - 20} more items")
+        shown = 0
+        for item in itertools.islice(toc, 20):  # Show first 20
+            logger.info("%s%s (p.%s)", "  " * (item.level - 1), item.title, item.page_number)
+            shown += 1
+        if len(toc) > shown:
+            logger.info("  ... and %d more items", len(toc) - shown)
     else:
         logger.info("\n[!] No table of contents found in PDF")
     
@@ -144,19 +211,30 @@ def main() -> int:
         help='Enable verbose output'
     )
     
+    # Shared backend option for all commands
+    backend_parser = argparse.ArgumentParser(add_help=False)
+    backend_parser.add_argument(
+        '-b', '--backend',
+        choices=BACKENDS,
+        help='PDF extraction backend (default: $DOCTOMD_BACKEND or pymupdf)'
+    )
+    
     subparsers = parser.add_subparsers(dest='command', help='Commands')
     
     # Convert command
     convert_parser = subparsers.add_parser(
         'convert',
+        parents=[backend_parser],
         help='Convert a single PDF file'
     )
     convert_parser.add_argument(
         'input',
+        type=_existing_file,
         help='Path to input PDF file'
     )
     convert_parser.add_argument(
         '-o', '--output',
+        type=Path,
         help='Output file path (default: same as input with .md extension)'
     )
     convert_parser.add_argument(
@@ -187,14 +265,17 @@ def main() -> int:
     # Batch command
     batch_parser = subparsers.add_parser(
         'batch',
+        parents=[backend_parser],
         help='Convert all PDFs in a directory'
     )
     batch_parser.add_argument(
         'input_dir',
+        type=_existing_dir,
         help='Directory containing PDF files'
     )
     batch_parser.add_argument(
         '-o', '--output-dir',
+        type=Path,
         help='Output directory (default: input_dir/converted)'
     )
     batch_parser.add_argument(
@@ -208,15 +289,40 @@ def main() -> int:
         action='store_true',
         help='Disable YAML frontmatter in output'
     )
+    batch_parser.add_argument(
+        '-w', '--workers',
+        type=_non_negative_int,
+        default=0,
+        help='Number of parallel worker processes; 1 converts in-process '
+             '(default: 0, one per CPU)'
+    )
+    batch_parser.add_argument(
+        '-r', '--recursive',
+        action='store_true',
+        help='Also convert PDFs in subdirectories'
+    )
+    batch_parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        help='Cache conversion results here so reruns skip unchanged PDFs '
+             '(the entries are pickles: use a directory only you can write to)'
+    )
+    batch_parser.add_argument(
+        '--json-summary',
+        metavar='PATH',
+        help='Write a JSON summary (counts, timing, failures) to this file'
+    )
     batch_parser.set_defaults(func=cmd_batch)
     
     # Info command
     info_parser = subparsers.add_parser(
         'info',
+        parents=[backend_parser],
         help='Show PDF metadata and table of contents'
     )
     info_parser.add_argument(
         'input',
+        type=_existing_file,
         help='Path to PDF file'
     )
     info_parser.set_defaults(func=cmd_info)
@@ -227,6 +333,15 @@ def main() -> int:
         parser.print_help()
         return 0
     
+    if args.backend is None:
+        # Checked here because argparse doesn't validate defaults
+        args.backend = os.environ.get('DOCTOMD_BACKEND', 'pymupdf')
+        if args.backend not in BACKENDS:
+            parser.error(
+                f"invalid DOCTOMD_BACKEND {args.backend!r} "
+                f"(choose from {', '.join(BACKENDS)})"
+            )
+    
     setup_logging(args.verbose)
     return args.func(args)
 
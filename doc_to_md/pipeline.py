@@ -1,11 +1,17 @@
 """Main conversion pipeline orchestrating PDF to Markdown conversion."""
 
-import json
+import fnmatch
+import functools
+import hashlib
 import logging
-from dataclasses import dataclass, field
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
+from . import __version__
 from .post_processing import (
     MetadataEnricher,
     MetadataEnricherConfig,
@@ -23,18 +29,25 @@ from .processing import (
     Chunk,
     ConversionResult,
     PDFConverterBase,
+    PdfiumConverter,
     PyMuPDFConverter,
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Version of the cache entry layout. It is part of every cache key together
+# with the package version, so entries written by another release are never
+# loaded; bump it when ConversionResult changes within a release
+_CACHE_FORMAT = 1
+
 
 @dataclass
 class PipelineConfig:
     """Configuration for the conversion pipeline."""
-    # Converter backend (default: pymupdf4llm)
-    converter: str = "pymupdf"
+    # Converter backend: "pymupdf" (pymupdf4llm) or "pdfium" (pypdfium2).
+    # Defaults to the DOCTOMD_BACKEND environment variable, then "pymupdf".
+    converter: str = field(default_factory=lambda: os.environ.get("DOCTOMD_BACKEND", "pymupdf"))
     
     # Segmentation settings
     segmenter_config: SegmenterConfig = field(default_factory=SegmenterConfig)
@@ -64,6 +77,13 @@ class PipelineConfig:
     fix_links: bool = True
     fix_code_blocks: bool = False  # Off by default, can be too aggressive
     run_whitespace_norm: bool = True
+    # Fold whitespace normalization into the cleanup pass when both run
+    fuse_passes: bool = True
+    
+    # Directory for cached conversion results, keyed by PDF content and
+    # config. Disabled when None. Entries are pickles, so only point this at
+    # a directory no one else can write to: loading one runs arbitrary code.
+    cache_dir: Optional[Path] = None
 
 
 class DocToMd:
@@ -89,6 +109,8 @@ class DocToMd:
                 segmenter_args['target_chunk_size'] = kwargs.pop('chunk_size')
             if 'max_chunk_size' in kwargs:
                 segmenter_args['max_chunk_size'] = kwargs.pop('max_chunk_size')
+            if 'size_unit' in kwargs:
+                segmenter_args['size_unit'] = kwargs.pop('size_unit')
             
             if segmenter_args:
                 kwargs['segmenter_config'] = SegmenterConfig(**segmenter_args)
@@ -96,6 +118,8 @@ class DocToMd:
             self.config = PipelineConfig(**kwargs)
             
         self._converter: Optional[PDFConverterBase] = None
+        self._processor_key: Optional[tuple] = None
+        self._refresh_processors()
     
     @property
     def converter(self) -> PDFConverterBase:
@@ -103,10 +127,54 @@ class DocToMd:
         if self._converter is None:
             if self.config.converter == "pymupdf":
                 self._converter = PyMuPDFConverter()
+            elif self.config.converter == "pdfium":
+                self._converter = PdfiumConverter()
             else:
                 raise ValueError(f"Unknown converter: {self.config.converter}")
         return self._converter
     
+    def _refresh_processors(self) -> None:
+        """Build the document-independent processors for the current config.
+        
+        They are reused for every file and only rebuilt when the config, or
+        one of the processor configs in it, has changed since they were
+        built. The TOC-based processors are built per document.
+        """
+        config = self.config
+        fuse = config.fuse_passes and config.run_cleanup and config.run_whitespace_norm
+        key = (
+            fuse, config.link_fixer_config, config.code_block_config,
+            config.cleanup_config, config.whitespace_config,
+        )
+        if key == self._processor_key:
+            return
+        
+        self._fuse_whitespace = fuse
+        cleanup_config = config.cleanup_config
+        if fuse:
+            # Stage 7 is done by the cleanup's final blank line step
+            cleanup_config = replace(cleanup_config, collapse_blank_lines=True)
+        self._link_fixer = LinkFixer(config.link_fixer_config)
+        self._code_fixer = CodeBlockFixer(config.code_block_config)
+        self._cleanup = MarkdownCleanup(cleanup_config)
+        self._whitespace_norm = WhitespaceNormalizer(config.whitespace_config)
+        # Copies, so a processor config changed in place no longer compares equal
+        self._processor_key = (fuse,) + tuple(replace(c) for c in key[1:])
+    
+    def warmup(self) -> None:
+        """Pay one-off start-up costs before the first conversion.
+        
+        Creates the converter, importing its backend, and runs the markdown
+        stages over a small sample so a timed or pooled run starts warm.
+        """
+        self.converter
+        self._refresh_processors()
+        sample = "# Title\n\nSee [docs](https://example.com/a).\n\n\n\n- item\n"
+        sample = self._link_fixer.fix_links(sample)
+        sample = self._code_fixer.fix_code_blocks(sample)
+        sample = self._cleanup.clean(sample)
+        self._whitespace_norm.normalize(sample)
+    
     def convert(self, pdf_path: Union[str, Path]) -> ConversionResult:
         """Run the full conversion pipeline.
         
@@ -118,16 +186,39 @@ class DocToMd:
         """
         path = Path(pdf_path)
         logger.info(f"Starting conversion of {path.name}")
+        self._refresh_processors()
+        
+        # A cached final result skips every stage, a cached converter result
+        # skips Stage 1 when only post-processing settings changed
+        result_key = convert_key = None
+        if self.config.cache_dir is not None:
+            pdf_hash = _file_digest(path)
+            version = f"v{__version__}-{_CACHE_FORMAT}"
+            convert_key = f"{pdf_hash}-convert-{self.config.converter}-{version}"
+            result_key = f"{pdf_hash}-result-{self._config_digest()}-{version}"
+            cached = self._cache_load(result_key)
+            if cached is not None:
+                logger.info(f"Using cached result for {path.name}")
+                return cached
         
         # Stage 1: PDF Conversion
-        logger.info("Stage 1: Converting PDF to markdown")
-        result = self.converter.convert(path)
+        result = self._cache_load(convert_key) if convert_key else None
+        if result is None:
+            logger.info("Stage 1: Converting PDF to markdown")
+            result = self.converter.convert(path)
+            if convert_key:
+                self._cache_store(convert_key, result)
+        else:
+            logger.info("Stage 1: Using cached PDF conversion")
         
-        # Stage 2: TOC Processing
+        # Stage 2: TOC validation. The section tree is only built if a later
+        # stage needs it
         if self.config.extract_toc and result.toc:
-            logger.info("Stage 2: Processing table of contents")
-            # This just verifies the TOC can be processed
-            TOCProcessor(result.toc)
+            logger.info("Stage 2: Validating table of contents")
+            # Only reported: the TOC is kept so the later stages see the
+            # same TOC whether or not this stage runs
+            if not TOCProcessor.validate(result.toc):
+                logger.warning("Table of contents has malformed entries")
         
         # === MARKDOWN CLEANUP PROCESSING STAGES ===
         
@@ -140,26 +231,22 @@ class DocToMd:
         # Stage 4: Fix links
         if self.config.fix_links:
             logger.info("Stage 4: Fixing links")
-            link_fixer = LinkFixer(self.config.link_fixer_config)
-            result.markdown = link_fixer.fix_links(result.markdown)
+            result.markdown = self._link_fixer.fix_links(result.markdown)
         
         # Stage 5: Fix code blocks (optional, can be aggressive)
         if self.config.fix_code_blocks:
             logger.info("Stage 5: Fixing code blocks")
-            code_fixer = CodeBlockFixer(self.config.code_block_config)
-            result.markdown = code_fixer.fix_code_blocks(result.markdown)
+            result.markdown = self._code_fixer.fix_code_blocks(result.markdown)
         
         # Stage 6: Cleanup (whitespace normalization, page artifacts)
         if self.config.run_cleanup:
             logger.info("Stage 6: Cleaning up markdown")
-            cleanup = MarkdownCleanup(self.config.cleanup_config)
-            result.markdown = cleanup.clean(result.markdown)
+            result.markdown = self._cleanup.clean(result.markdown)
  
         # Stage 7: Whitespace Normalization
-        if self.config.run_whitespace_norm:
+        if self.config.run_whitespace_norm and not self._fuse_whitespace:
             logger.info("Stage 7: Normalizing whitespace")
-            whitespace_norm = WhitespaceNormalizer(self.config.whitespace_config)
-            result.markdown = whitespace_norm.normalize(result.markdown)
+            result.markdown = self._whitespace_norm.normalize(result.markdown)
  
         # === POST MARKDOWN PROCESSING STAGES ===
  
@@ -183,9 +270,50 @@ class DocToMd:
             )
             result.chunks = enricher.enrich_chunks(result.chunks)
         
+        if result_key:
+            self._cache_store(result_key, result)
+        
         logger.info("Conversion complete")
         return result
     
+    def _config_digest(self) -> str:
+        """Hash the settings that affect a conversion result."""
+        config = replace(self.config, cache_dir=None)
+        return hashlib.sha256(repr(config).encode('utf-8')).hexdigest()[:16]
+    
+    def _cache_load(self, key: str) -> Optional[ConversionResult]:
+        """Load a cached result, or None if it is missing or unreadable."""
+        cache_file = Path(self.config.cache_dir) / f"{key}.pkl"
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+            return None
+    
+    def _cache_store(self, key: str, result: ConversionResult) -> None:
+        """Write a result to the cache atomically.
+        
+        A failed write is logged and skipped; the conversion goes on uncached.
+        """
+        cache_dir = Path(self.config.cache_dir)
+        # Write under a process-unique name, then rename, so concurrent
+        # workers and interrupted runs never leave a partial entry
+        tmp_file = cache_dir / f"{key}.{os.getpid()}.tmp"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_dir / f"{key}.pkl")
+        except Exception as e:
+            logger.warning(f"Could not write cache entry {key}: {e}")
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+    
     def run(
         self,
         input_path: Union[str, Path],
@@ -221,23 +349,46 @@ class DocToMd:
     ) -> Path:
         """Internal helper to convert and write to specific file."""
         result = self.convert(pdf_path)
-        output_path = Path(output_path)
+        return self._write_result(result, Path(output_path), output_format)
+    
+    def _write_result(
+        self,
+        result: ConversionResult,
+        output_path: Path,
+        output_format: Optional[str] = None
+    ) -> Path:
+        """Write a conversion result to a file.
+        
+        The output is written to a temporary file next to the target and
+        renamed into place, so an interrupted run never leaves a truncated
+        file behind.
+        
+        Args:
+            result: Conversion result to write.
+            output_path: Destination file.
+            output_format: Optional format override (markdown/json).
+            
+        Returns:
+            Path to the created file.
+        """
         output_format = output_format or self.config.output_format
+        tmp_path = output_path.with_name(f"{output_path.name}.tmp")
         
         if output_format == "json":
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
+            result.write_json(tmp_path)
         else:
-            markdown = generate_markdown_output(
-                result.chunks if result.chunks else [],
-                result.metadata,
-                include_frontmatter=self.config.include_frontmatter
-            )
-            # If no chunks, use raw markdown
-            if not result.chunks:
+            if result.chunks:
+                markdown = generate_markdown_output(
+                    result.chunks,
+                    result.metadata,
+                    include_frontmatter=self.config.include_frontmatter
+                )
+            else:
+                # If no chunks, use raw markdown
                 markdown = result.markdown
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 f.write(markdown)
+        os.replace(tmp_path, output_path)
         
         logger.info(f"Output saved to {output_path}")
         return output_path
@@ -246,33 +397,182 @@ class DocToMd:
         self,
         input_dir: Union[str, Path],
         output_dir: Union[str, Path],
-        pattern: str = "*.pdf"
+        pattern: str = "*.pdf",
+        max_workers: Optional[int] = None,
+        parallel: bool = False,
+        recursive: bool = False,
+        on_file_done: Optional[Callable[[Path, Optional[Exception]], None]] = None,
+        inputs: Optional[list[tuple[Path, int]]] = None
     ) -> list[Path]:
-        """Convert all PDFs in a directory."""
+        """Convert all PDFs in a directory.
+        
+        Files are converted one at a time in this process by default. With
+        ``parallel`` set they run in a process pool instead (PyMuPDF is not
+        thread-safe), unless there is only one file or worker. Each worker
+        builds its own pipeline from ``self.config``, so a converter set on
+        this instance is not used there.
+        
+        Args:
+            input_dir: Directory containing the PDFs.
+            output_dir: Directory for the converted files.
+            pattern: Glob pattern selecting the input files, see find_inputs.
+            max_workers: Number of worker processes (default: number of CPUs).
+            parallel: Whether to convert in worker processes.
+            recursive: Also convert files in subdirectories. Their outputs
+                go to the same subdirectories under ``output_dir``.
+            on_file_done: Called with each input file and the exception it
+                raised (None on success) as soon as its output is written.
+                Calls come one at a time, but not necessarily from the
+                calling thread.
+            inputs: Files to convert with their sizes, as returned by
+                find_inputs for ``input_dir``, when the caller has already
+                listed them. By default they are found with ``pattern``
+                and ``recursive``.
+            
+        Returns:
+            Paths of the created files, in input order. Failed files are
+            skipped, and logged unless ``on_file_done`` is given.
+        """
         input_dir = Path(input_dir)
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        output_paths = []
-        for pdf_file in input_dir.glob(pattern):
-            output_name = pdf_file.stem
-            output_path = output_dir / output_name
+        if inputs is None:
+            inputs = find_inputs(input_dir, pattern, recursive)
+        # Mirror subdirectories so recursive runs don't collide on names
+        jobs = [
+            (pdf_file, output_dir / pdf_file.relative_to(input_dir).with_suffix(''))
+            for pdf_file, _ in inputs
+        ]
+        for output_parent in {output_path.parent for _, output_path in jobs}:
+            output_parent.mkdir(parents=True, exist_ok=True)
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs)) if parallel else 1
+        
+        # Output path of each finished job, by job index
+        done: dict[int, Path] = {}
+        
+        def finish(index: int, output_path: Optional[Path], error: Optional[Exception]) -> None:
+            pdf_file = jobs[index][0]
+            if error is None:
+                done[index] = output_path
+            elif on_file_done is None:
+                logger.error(f"Failed to convert {pdf_file}: {error}")
+            if on_file_done is not None:
+                on_file_done(pdf_file, error)
+        
+        def write(index: int, result: ConversionResult) -> None:
             try:
-                result_path = self.run(pdf_file, output_path)
-                output_paths.append(result_path)
+                output_path = self._write_result(result, jobs[index][1])
             except Exception as e:
-                logger.error(f"Failed to convert {pdf_file}: {e}")
+                finish(index, None, e)
+            else:
+                finish(index, output_path, None)
+        
+        if workers <= 1:
+            # Write each result on a background thread while the next PDF
+            # converts. That thread also reports failed conversions, so every
+            # file is reported from one thread, in order, once it is done
+            with ThreadPoolExecutor(max_workers=1) as io_pool:
+                futures = []
+                for index, (pdf_file, _) in enumerate(jobs):
+                    try:
+                        result = self.convert(pdf_file)
+                    except Exception as e:
+                        futures.append(io_pool.submit(finish, index, None, e))
+                    else:
+                        futures.append(io_pool.submit(write, index, result))
+            # Re-raise anything on_file_done raised
+            for future in futures:
+                future.result()
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.config,)
+            ) as executor:
+                # Start the largest files first so a big PDF picked up last
+                # doesn't leave the other workers idle at the end
+                by_size = sorted(range(len(jobs)), key=lambda i: inputs[i][1], reverse=True)
+                futures = {executor.submit(_run_in_worker, *jobs[i]): i for i in by_size}
+                for future in as_completed(futures):
+                    error = future.exception()
+                    finish(futures[future], None if error else future.result(), error)
+        
+        return [done[index] for index in sorted(done)]
+
+
+def find_inputs(
+    input_dir: Path,
+    pattern: str = "*.pdf",
+    recursive: bool = False
+) -> list[tuple[Path, int]]:
+    """List files matching a glob pattern with their sizes, sorted by path.
+    
+    Patterns without a directory part are matched case-insensitively against
+    the file names from ``os.scandir`` listings, so ".PDF" exports are found
+    by "*.pdf" and no Path is built or stat-ed per skipped entry. Other
+    patterns are passed to Path.glob (or Path.rglob when recursive).
+    
+    Args:
+        input_dir: Directory to search.
+        pattern: Glob pattern selecting the files.
+        recursive: Whether to descend into subdirectories.
         
-        return output_paths
+    Returns:
+        Sorted list of ``(path, size in bytes)`` pairs.
+    """
+    if '/' in pattern or os.sep in pattern:
+        paths = input_dir.rglob(pattern) if recursive else input_dir.glob(pattern)
+        return sorted((path, path.stat().st_size) for path in paths if path.is_file())
+    
+    pattern = pattern.lower()
+    inputs = []
+    pending = [input_dir]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file() and fnmatch.fnmatchcase(entry.name.lower(), pattern):
+                    inputs.append((Path(entry.path), entry.stat().st_size))
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+    return sorted(inputs)
+
+
+def _file_digest(path: Path) -> str:
+    """Short SHA-256 of a file's contents."""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()[:16]
+
+
+# Pipeline owned by the current worker process (see _init_worker)
+_WORKER_PIPELINE: Optional[DocToMd] = None
+
+
+def _init_worker(config: PipelineConfig) -> None:
+    """Build one pipeline per worker process and reuse it for every file."""
+    global _WORKER_PIPELINE
+    _WORKER_PIPELINE = DocToMd(config=config)
+    _WORKER_PIPELINE.warmup()
+
+
+def _run_in_worker(pdf_path: Path, output_path: Path) -> Path:
+    """Convert a single PDF with the worker process pipeline."""
+    return _WORKER_PIPELINE.run(pdf_path, output_path)
 
 
 # Alias for backward compatibility
 ConversionPipeline = DocToMd
 
 
+@functools.lru_cache(maxsize=None)
+def _default_pipeline(converter: str) -> DocToMd:
+    """Shared default-config pipeline for quick_convert, one per backend."""
+    return DocToMd(converter=converter)
+
+
 def quick_convert(pdf_path: Union[str, Path]) -> str:
     """Quick conversion function for simple use cases."""
-    pipeline = DocToMd()
+    pipeline = _default_pipeline(PipelineConfig().converter)
     result = pipeline.convert(pdf_path)
     
     if result.chunks:
@@ -1,8 +1,57 @@
 """Code block fixer for markdown content."""
 
+import functools
+import io
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
+
+
+# Inline code: command-line flags, file paths and environment variables
+_RE_INLINE_CODE = re.compile(
+    r'(?<!\`)\s(?P<flag>-{1,2}[a-zA-Z][a-zA-Z0-9\-_=]+)(?!\`)'
+    r'|(?<!\`)(?P<path>(?:/[a-zA-Z0-9_\-\.]+)+)(?!\`)'
+    r'|(?<!\`)(?P<env>\$\{?[A-Z_][A-Z0-9_]*\}?)(?!\`)'
+)
+
+# Line classification patterns
+_RE_PROMPT = re.compile(r'^[\$#>]\s+\w+')
+_RE_ASSIGN = re.compile(r'\w+\s*=\s*["\'\d\[]')
+_RE_SHELL_PROMPT = re.compile(r'^[\$#]\s+')
+_RE_FENCE = re.compile(r'^\s*```')
+
+# Line prefixes that mark markdown structure rather than code
+_MARKDOWN_PREFIXES = ('#', '|', '-', '>', '*', '+')
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_code_patterns(
+    indicators: tuple,
+) -> tuple[Optional[re.Pattern], re.Pattern]:
+    """Compile the indicator-dependent code detection patterns.
+    
+    Cached per indicator set so fixers sharing a config reuse the patterns.
+    Every line accepted by ``CodeBlockFixer._looks_like_code`` also matches
+    the scan pattern somewhere in the document, so a miss means there is
+    nothing to wrap.
+    
+    Args:
+        indicators: Keywords that indicate code.
+        
+    Returns:
+        Tuple of (case-insensitive indicator alternation or None,
+        multiline pattern for a single search over the whole document).
+    """
+    indicator_re = None
+    if indicators:
+        indicator_re = re.compile(
+            '|'.join(re.escape(i) for i in indicators),
+            re.IGNORECASE
+        )
+    alternatives = [r'^\s*[\$#>]\s+\w+', _RE_ASSIGN.pattern]
+    if indicator_re is not None:
+        alternatives.append(f'(?i:{indicator_re.pattern})')
+    return indicator_re, re.compile('|'.join(alternatives), re.MULTILINE)
 
 
 @dataclass
@@ -39,6 +88,9 @@ class CodeBlockFixer:
             config: Configuration options.
         """
         self.config = config or CodeBlockFixerConfig()
+        self._indicator_re, self._code_scan_re = _compile_code_patterns(
+            tuple(self.config.code_indicators)
+        )
     
     def fix_code_blocks(self, markdown: str) -> str:
         """Fix code block formatting in markdown.
@@ -71,30 +123,15 @@ class CodeBlockFixer:
         Returns:
             Markdown with fixed inline code.
         """
-        result = markdown
-        
-        # Wrap command-line arguments: --option, -flag
-        result = re.sub(
-            r'(?<!\`)\s(-{1,2}[a-zA-Z][a-zA-Z0-9\-_=]+)(?!\`)',
-            r' `\1`',
-            result
-        )
-        
-        # Wrap file paths: /path/to/file, C:\path\to\file
-        result = re.sub(
-            r'(?<!\`)((?:/[a-zA-Z0-9_\-\.]+)+)(?!\`)',
-            r'`\1`',
-            result
-        )
-        
-        # Wrap environment variables: $VAR, ${VAR}
-        result = re.sub(
-            r'(?<!\`)(\$\{?[A-Z_][A-Z0-9_]*\}?)(?!\`)',
-            r'`\1`',
-            result
-        )
+        def wrap(match: re.Match) -> str:
+            # Command-line arguments (--option, -flag) keep their leading space
+            if match.lastgroup == 'flag':
+                return f" `{match.group('flag')}`"
+            # File paths (/path/to/file) and environment variables ($VAR, ${VAR})
+            return f"`{match.group(match.lastgroup)}`"
         
-        return result
+        # Single pass over the document for all inline code kinds
+        return _RE_INLINE_CODE.sub(wrap, markdown)
     
     def _detect_and_wrap_code_blocks(self, markdown: str) -> str:
         """Detect code-like content and wrap in fenced blocks.
@@ -105,58 +142,88 @@ class CodeBlockFixer:
         Returns:
             Markdown with detected code wrapped.
         """
-        lines = markdown.split('\n')
-        result_lines = []
+        # One scan of the whole buffer rules out documents with no code lines
+        if not self._code_scan_re.search(markdown):
+            return markdown
+        
+        out = io.StringIO()
+        needs_separator = False
+        
+        def write_line(text: str) -> None:
+            nonlocal needs_separator
+            if needs_separator:
+                out.write('\n')
+            out.write(text)
+            needs_separator = True
+        
         in_code_block = False
-        code_buffer = []
+        # Start index of the pending code run in ``lines``, if any
+        buffer_start = None
         detected_lang = ''
         
+        lines = markdown.split('\n')
         for i, line in enumerate(lines):
             # Check if already in a fenced block
-            if line.strip().startswith('```'):
+            if _RE_FENCE.match(line):
+                if buffer_start is not None:
+                    # Keep pending code lines ahead of the fence
+                    self._flush_code_buffer(lines[buffer_start:i], detected_lang, write_line)
+                    buffer_start = None
+                    detected_lang = ''
+                
                 if in_code_block:
                     # End of existing block
                     in_code_block = False
                 else:
                     # Start of existing block
                     in_code_block = True
-                result_lines.append(line)
+                write_line(line)
                 continue
             
             if in_code_block:
-                result_lines.append(line)
+                write_line(line)
                 continue
             
             # Detect if this line looks like code
             if self._looks_like_code(line):
-                if not code_buffer:
+                if buffer_start is None:
                     # Start new code block
+                    buffer_start = i
                     detected_lang = self._detect_language(line)
-                code_buffer.append(line)
             else:
-                if code_buffer:
+                if buffer_start is not None:
                     # End of code block, flush buffer
-                    if len(code_buffer) >= 2:  # Only wrap if 2+ lines
-                        result_lines.append(f'```{detected_lang}')
-                        result_lines.extend(code_buffer)
-                        result_lines.append('```')
-                    else:
-                        result_lines.extend(code_buffer)
-                    code_buffer = []
+                    self._flush_code_buffer(lines[buffer_start:i], detected_lang, write_line)
+                    buffer_start = None
                     detected_lang = ''
                 
-                result_lines.append(line)
+                write_line(line)
         
         # Flush any remaining buffer
-        if code_buffer:
-            if len(code_buffer) >= 2:
-                result_lines.append(f'```{detected_lang}')
-                result_lines.extend(code_buffer)
-                result_lines.append('```')
-            else:
-                result_lines.extend(code_buffer)
+        if buffer_start is not None:
+            self._flush_code_buffer(lines[buffer_start:], detected_lang, write_line)
+        
+        return out.getvalue()
+    
+    def _flush_code_buffer(
+        self,
+        code_buffer: list[str],
+        detected_lang: str,
+        write_line: Callable[[str], None]
+    ) -> None:
+        """Write buffered code lines, fenced if there are 2+ lines.
         
-        return '\n'.join(result_lines)
+        Args:
+            code_buffer: The buffered code lines.
+            detected_lang: Language detected from the first line.
+            write_line: Callback writing a single output line.
+        """
+        if len(code_buffer) >= 2:  # Only wrap if 2+ lines
+            write_line(f'```{detected_lang}')
+            write_line('\n'.join(code_buffer))
+            write_line('```')
+        else:
+            write_line(code_buffer[0])
     
     def _looks_like_code(self, line: str) -> bool:
         """Check if a line looks like code.
@@ -173,26 +240,19 @@ class CodeBlockFixer:
             return False
         
         # Skip markdown elements
-        if stripped.startswith('#'):
-            return False
-        if stripped.startswith('|') or stripped.startswith('-'):
-            return False
-        if stripped.startswith('>'):
-            return False
-        if stripped.startswith('*') or stripped.startswith('+'):
+        if stripped.startswith(_MARKDOWN_PREFIXES):
             return False
         
         # Check for code indicators
-        for indicator in self.config.code_indicators:
-            if indicator in stripped.lower():
-                return True
+        if self._indicator_re is not None and self._indicator_re.search(stripped):
+            return True
         
         # Check for command-prompt patterns
-        if re.match(r'^[\$#>]\s+\w+', stripped):
+        if _RE_PROMPT.match(stripped):
             return True
         
         # Check for assignment patterns
-        if re.search(r'\w+\s*=\s*["\'\d\[]', stripped):
+        if _RE_ASSIGN.search(stripped):
             return True
         
         return False
@@ -209,7 +269,7 @@ class CodeBlockFixer:
         stripped = line.strip().lower()
         
         # Shell commands
-        if re.match(r'^[\$#]\s+', stripped):
+        if _RE_SHELL_PROMPT.match(stripped):
             return 'bash'
         if any(cmd in stripped for cmd in ['racadm', 'ipmitool']):
             return 'bash'
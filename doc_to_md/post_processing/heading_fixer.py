@@ -1,16 +1,54 @@
 """Heading fixer that uses TOC to correct heading levels in markdown."""
 
+import bisect
+import functools
 import logging
+import math
 import re
 from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import Optional
+from typing import Iterator, Literal, Optional, Union, overload
 
 from ..processing.models import TOCItem
+from .toc_processor import _RE_HEADING
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+except ImportError:  # rapidfuzz is optional, only used to prefilter candidates
+    _rf_fuzz = None
 
 
 logger = logging.getLogger(__name__)
 
+# Prefixes that must agree between a heading and a TOC title for a fuzzy match
+_STRICT_PREFIXES = ('figure', 'table', 'prerequisites')
+
+# Translation table deleting bold/italic markers
+_DELETE_STARS = str.maketrans('', '', '*')
+# Same as a per-line heading match: the separator must not cross a newline
+_RE_HEADING_LINE = re.compile(r'^(#{1,6})[^\S\n]+(.+)$', re.MULTILINE)
+# A markdown heading or a line that is entirely bold text, in one match.
+# Applied to the whole document, so whitespace must not cross a newline
+_RE_HEADING_OR_BOLD = re.compile(
+    r'^(?:(?P<hashes>#{1,6})[^\S\n]+(?P<htext>.+)'
+    r'|[^\S\n]*\*\*(?P<btext>[^*\n]+)\*\*[^\S\n]*)$',
+    re.MULTILINE
+)
+_RE_INNER_BOLD = re.compile(r'\*+([^*]+)\*+')
+
+# Split chapter heading patterns (see _merge_split_headings)
+_RE_SPLIT_HEADING = re.compile(r'^(#{1,6})\s+(\d+)\s*\n+\s*#{1,6}\s+([^\n]+)', re.MULTILINE)
+_RE_SPLIT_HEADING_TEXT = re.compile(r'^(#{1,6})\s+(\d+)\s*\n+\s*([A-Z][^\n]{1,100})$', re.MULTILINE)
+_RE_SPLIT_BOLD_NUMBER = re.compile(r'^\s*\*\*(\d+)\*\*\s*\n+\s*(#{1,6})\s+([^\n]+)', re.MULTILINE)
+# Literal-led supersets of the patterns above, much cheaper to search for
+_RE_NUMBER_HEADING_HINT = re.compile(r'#\s+\d')
+_RE_BOLD_NUMBER_HINT = re.compile(r'\*\*\d+\*\*')
+
+
+def _prefix_key(title: str) -> tuple[bool, ...]:
+    """Return which of the strict prefixes a normalized title starts with."""
+    return tuple(title.startswith(p) for p in _STRICT_PREFIXES)
+
 
 @dataclass 
 class HeadingFixerConfig:
@@ -52,6 +90,10 @@ class HeadingFixer:
         self.toc = toc
         self.config = config or HeadingFixerConfig()
         self._toc_map = self._build_toc_map()
+        self._build_length_index()
+        # The TOC map is fixed after construction, so lookups can be memoized
+        # per instance (repeated running headers hit the cache).
+        self._find_toc_level = functools.lru_cache(maxsize=4096)(self._find_toc_level_impl)
     
     def _build_toc_map(self) -> dict[str, int]:
         """Build a map of normalized TOC titles to their levels.
@@ -59,11 +101,25 @@ class HeadingFixer:
         Returns:
             Dict mapping normalized title -> level.
         """
-        toc_map = {}
-        for item in self.toc:
-            normalized = self._normalize_title(item.title)
-            toc_map[normalized] = item.level
-        return toc_map
+        # Later entries win when two titles normalize the same, as before
+        normalize = self._normalize_title
+        return {normalize(item.title): item.level for item in self.toc}
+    
+    def _build_length_index(self) -> None:
+        """Index normalized TOC titles by length for fuzzy candidate lookup."""
+        # Position of each title in the TOC, used to keep candidates in TOC order
+        self._toc_order: dict[str, int] = {}
+        self._toc_by_len: dict[int, list[str]] = {}
+        # Strict prefix signature of each title, compared as a single tuple
+        self._toc_prefix_key: dict[str, tuple[bool, ...]] = {}
+        for index, title in enumerate(self._toc_map):
+            self._toc_order[title] = index
+            self._toc_prefix_key[title] = _prefix_key(title)
+            self._toc_by_len.setdefault(len(title), []).append(title)
+        self._toc_lengths = sorted(self._toc_by_len)
+        # One matcher per TOC title for the difflib fallback, created on first
+        # use; a matcher keeps its index of the second sequence between lookups
+        self._toc_matchers: dict[str, SequenceMatcher] = {}
     
     def _normalize_title(self, title: str) -> str:
         """Normalize a title for matching.
@@ -74,17 +130,14 @@ class HeadingFixer:
         Returns:
             Normalized title string.
         """
-        # Remove bold markers
-        title = re.sub(r'\*+', '', title)
-        # Remove extra whitespace
-        title = ' '.join(title.split())
-        # Convert to lowercase for matching
-        title = title.lower().strip()
-        return title
+        # Remove bold markers, lowercase and collapse whitespace in one go
+        return ' '.join(title.translate(_DELETE_STARS).lower().split())
     
-    def _find_toc_level(self, heading_text: str) -> Optional[int]:
+    def _find_toc_level_impl(self, heading_text: str) -> Optional[int]:
         """Find the TOC level for a heading.
         
+        Called through the memoized ``_find_toc_level`` set up in ``__init__``.
+        
         Args:
             heading_text: The heading text to look up.
             
@@ -98,30 +151,79 @@ class HeadingFixer:
             return self._toc_map[normalized]
         
         # Fuzzy match for slight variations
+        candidates = self._fuzzy_candidates(normalized)
+        if not candidates:
+            return None
+        
         best_match = None
         best_ratio = 0
+        min_ratio = self.config.min_match_ratio
         
-        for toc_title, level in self._toc_map.items():
-            # Strict prefix check: Prevent "Figure X" or "Table X" from matching 
-            # section titles that don't have the prefix, even if they have high similarity.
-            prefixes = ['figure', 'table', 'prerequisites']
-            mismatched_prefix = False
-            for p in prefixes:
-                if (normalized.startswith(p) and not toc_title.startswith(p)) or \
-                   (toc_title.startswith(p) and not normalized.startswith(p)):
-                    mismatched_prefix = True
-                    break
-            
-            if mismatched_prefix:
+        for toc_title in candidates:
+            # rapidfuzz's Indel ratio is an upper bound of the difflib ratio,
+            # so it only skips titles; the score itself is always difflib's
+            if _rf_fuzz is not None:
+                if _rf_fuzz.ratio(normalized, toc_title) < min_ratio * 100 - 1e-6:
+                    continue
+            matcher = self._toc_matchers.get(toc_title)
+            if matcher is None:
+                matcher = self._toc_matchers[toc_title] = SequenceMatcher(None, b=toc_title)
+            matcher.set_seq1(normalized)
+            # quick_ratio() is an upper bound from character counts, as in
+            # difflib.get_close_matches
+            if _rf_fuzz is None and matcher.quick_ratio() < min_ratio:
                 continue
-
-            ratio = SequenceMatcher(None, normalized, toc_title).ratio()
-            if ratio > best_ratio and ratio >= self.config.min_match_ratio:
+            ratio = matcher.ratio()
+            if ratio > best_ratio and ratio >= min_ratio:
                 best_ratio = ratio
-                best_match = level
+                best_match = self._toc_map[toc_title]
         
         return best_match
     
+    def _fuzzy_candidates(self, normalized: str) -> list[str]:
+        """Select TOC titles that can possibly reach the fuzzy match threshold.
+        
+        A similarity ratio is bounded by ``2 * min(a, b) / (a + b)`` of the two
+        string lengths, so titles whose length is too far off are skipped
+        without running the matcher.
+        
+        Args:
+            normalized: The normalized heading text.
+            
+        Returns:
+            List of candidate normalized TOC titles.
+        """
+        min_ratio = self.config.min_match_ratio
+        length = len(normalized)
+        if min_ratio > 0:
+            # Small tolerance so titles exactly on the threshold are kept
+            min_len = math.ceil(length * min_ratio / (2 - min_ratio) - 1e-9)
+            max_len = math.floor(length * (2 - min_ratio) / min_ratio + 1e-9)
+        else:
+            min_len, max_len = 0, math.inf
+        
+        # Only visit the length buckets inside the allowed range
+        lo = bisect.bisect_left(self._toc_lengths, min_len)
+        hi = bisect.bisect_right(self._toc_lengths, max_len)
+        
+        # Strict prefix check: Prevent "Figure X" or "Table X" from matching 
+        # section titles that don't have the prefix, even if they have high similarity.
+        prefix_key = _prefix_key(normalized)
+        toc_prefix_key = self._toc_prefix_key
+        candidates = [
+            toc_title for toc_title in self._iter_titles_by_length(lo, hi)
+            if toc_prefix_key[toc_title] == prefix_key
+        ]
+        
+        # Keep TOC order so ties resolve to the earliest entry, as before
+        candidates.sort(key=self._toc_order.__getitem__)
+        return candidates
+    
+    def _iter_titles_by_length(self, lo: int, hi: int) -> Iterator[str]:
+        """Yield TOC titles from the length buckets ``_toc_lengths[lo:hi]``."""
+        for title_length in self._toc_lengths[lo:hi]:
+            yield from self._toc_by_len[title_length]
+    
     
     def _merge_split_headings(self, markdown: str) -> str:
         """Merge split chapter headings.
@@ -134,143 +236,229 @@ class HeadingFixer:
         To:
         # 1 Overview
         """
-        # Pattern 1: Both parts are already headings (any amount of whitespace between)
-        pattern1 = r'^(#{1,6})\s+(\d+)\s*\n+\s*#{1,6}\s+([^\n]+)'
-        markdown = re.sub(pattern1, r'\1 \2 \3', markdown, flags=re.MULTILINE)
+        # All three patterns need a heading marker
+        if '#' not in markdown:
+            return markdown
         
-        # Pattern 2: First part is heading + number, second part is just text (starts with uppercase)
-        # This handles cases where the second part hasn't been promoted to heading yet.
-        # We look for a line that starts with uppercase letter and is at most 100 chars (short title)
-        pattern2 = r'^(#{1,6})\s+(\d+)\s*\n+\s*([A-Z][^\n]{1,100})$'
-        markdown = re.sub(pattern2, r'\1 \2 \3', markdown, flags=re.MULTILINE)
+        # Patterns 1 and 2 both start with a number-only heading
+        if _RE_NUMBER_HEADING_HINT.search(markdown):
+            # Pattern 1: Both parts are already headings (any amount of whitespace between)
+            markdown = _RE_SPLIT_HEADING.sub(r'\1 \2 \3', markdown)
+            
+            # Pattern 2: First part is heading + number, second part is just text (starts with uppercase)
+            # This handles cases where the second part hasn't been promoted to heading yet.
+            # We look for a line that starts with uppercase letter and is at most 100 chars (short title)
+            markdown = _RE_SPLIT_HEADING_TEXT.sub(r'\1 \2 \3', markdown)
         
         # Pattern 3: Bold number followed by heading
-        pattern3 = r'^\s*\*\*(\d+)\*\*\s*\n+\s*(#{1,6})\s+([^\n]+)'
-        markdown = re.sub(pattern3, r'\2 \1 \3', markdown, flags=re.MULTILINE)
+        if _RE_BOLD_NUMBER_HINT.search(markdown):
+            markdown = _RE_SPLIT_BOLD_NUMBER.sub(r'\2 \1 \3', markdown)
 
         return markdown
 
-    def fix_headings(self, markdown: str) -> str:
+    @overload
+    def fix_headings(self, markdown: str, collect_stats: Literal[False] = False) -> str: ...
+    
+    @overload
+    def fix_headings(self, markdown: str, collect_stats: Literal[True]) -> tuple[str, dict]: ...
+    
+    def fix_headings(
+        self,
+        markdown: str,
+        collect_stats: bool = False
+    ) -> Union[str, tuple[str, dict]]:
         """Fix heading levels in markdown based on TOC.
         
         Args:
             markdown: The markdown content.
+            collect_stats: Also return statistics (same keys as
+                ``get_heading_statistics``) for the headings this pass fixes.
+                They are counted after line endings are normalized and split
+                headings are merged, so a split "# 1" / "# Overview" pair
+                counts as one heading "1 Overview".
             
         Returns:
-            Markdown with corrected heading levels.
+            Markdown with corrected heading levels, or a
+            ``(markdown, stats)`` tuple when ``collect_stats`` is set.
         """
         # Normalize line endings
-        markdown = markdown.replace('\r\n', '\n').replace('\r', '\n')
+        if '\r' in markdown:
+            markdown = markdown.replace('\r\n', '\n').replace('\r', '\n')
+        
+        stats = self._empty_statistics() if collect_stats else None
+        
+        # Every rule below needs a heading marker or a bold line
+        if '#' not in markdown and '**' not in markdown:
+            return (markdown, stats) if stats is not None else markdown
         
         # Pre-process: Merge split headings (Phase 1)
         markdown = self._merge_split_headings(markdown)
         
-        lines = markdown.split('\n')
-        result_lines = []
+        if self._toc_map:
+            # Only heading and bold lines are visited, the rest is copied by re
+            fixed_markdown = _RE_HEADING_OR_BOLD.sub(
+                functools.partial(self._fix_heading_line, stats=stats), markdown
+            )
+        else:
+            # Nothing can match an empty TOC, skip the per-line lookups
+            fixed_markdown = self._fix_headings_without_toc(markdown, stats)
+        
+        # Post-process: Merge split headings
+        # We do this AFTER the loop because the loop might have promoted bold text (e.g. **1**)
+        # to headings (e.g. # 1), which our regex expects.
+        fixed_markdown = self._merge_split_headings(fixed_markdown)
+        
+        if stats is not None:
+            return fixed_markdown, stats
+        return fixed_markdown
+    
+    def _fix_heading_line(self, match: re.Match, stats: Optional[dict] = None) -> str:
+        """Correct one heading or bold line from the TOC.
         
-        for line in lines:
-            line_stripped = line.strip()
-            # Check if this is a heading
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            # Check if this is a bold line that might be a heading
-            bold_match = re.match(r'^\s*\*\*([^*]+)\*\*\s*$', line)
+        Args:
+            match: ``_RE_HEADING_OR_BOLD`` match covering the whole line.
+            stats: Optional statistics dict updated in place.
             
-            clean_text = ""
-            current_hashes = ""
-            is_modified = False
+        Returns:
+            The fixed line.
+        """
+        line = match.group(0)
+        current_hashes = match.group('hashes')
+        
+        if current_hashes is not None:
+            heading_text = match.group('htext')
+            clean_text = heading_text
             
-            if heading_match:
-                current_hashes = heading_match.group(1)
-                heading_text = heading_match.group(2)
-                clean_text = heading_text
-                
-                # Clean up the heading text
-                if self.config.remove_bold_from_headings:
-                    clean_text = re.sub(r'\*+([^*]+)\*+', r'\1', clean_text)
-                    clean_text = clean_text.strip()
-                
-                # Look up the correct level in TOC
-                toc_level = self._find_toc_level(heading_text)
-                
-                if toc_level is not None:
-                    # Use TOC level
-                    new_hashes = '#' * toc_level
-                    old_line = line
-                    line = f"{new_hashes} {clean_text}"
-                    if old_line != line:
-                        logger.debug(f"Fixing heading: '{old_line.strip()}' -> '{line.strip()}'")
-                    is_modified = True
-                elif self.config.bold_non_toc_headings:
-                    # Not in TOC, convert to bold
-                    line = f"**{clean_text}**"
-                    logger.debug(f"Bolding non-TOC heading: '{heading_match.group(0).strip()}' -> '{line}'")
-                elif self.config.remove_bold_from_headings:
-                    # Keep original level but clean text
-                    line = f"{current_hashes} {clean_text}"
+            # Clean up the heading text
+            if self.config.remove_bold_from_headings:
+                clean_text = _RE_INNER_BOLD.sub(r'\1', clean_text)
+                clean_text = clean_text.strip()
             
-            elif bold_match:
-                # Potential heading disguised as bold text
-                text = bold_match.group(1).strip()
-                
-                # Skip if this looks like a table title (handled by TableMerger)
-                if text.lower().startswith('table'):
-                    result_lines.append(line)
-                    continue
-                
-                toc_level = self._find_toc_level(text)
-                
-                if toc_level is not None:
-                    # Promote bold text to heading
-                    new_hashes = '#' * toc_level
-                    line = f"{new_hashes} {text}"
+            # Look up the correct level in TOC
+            toc_level = self._find_toc_level(heading_text)
+            
+            if stats is not None:
+                self._record_heading(stats, len(current_hashes), heading_text, toc_level)
             
-            result_lines.append(line)
+            if toc_level is not None:
+                # Use TOC level
+                new_hashes = '#' * toc_level
+                old_line = line
+                line = f"{new_hashes} {clean_text}"
+                if old_line != line:
+                    logger.debug(f"Fixing heading: '{old_line.strip()}' -> '{line.strip()}'")
+            elif self.config.bold_non_toc_headings:
+                # Not in TOC, convert to bold
+                line = f"**{clean_text}**"
+                logger.debug(f"Bolding non-TOC heading: '{match.group(0).strip()}' -> '{line}'")
+            elif self.config.remove_bold_from_headings:
+                # Keep original level but clean text
+                line = f"{current_hashes} {clean_text}"
         
-        # Re-assemble markdown
-        fixed_markdown = '\n'.join(result_lines)
+        else:
+            # Potential heading disguised as bold text
+            text = match.group('btext').strip()
+            
+            # Skip if this looks like a table title (handled by TableMerger)
+            if text.lower().startswith('table'):
+                return line
+            
+            toc_level = self._find_toc_level(text)
+            
+            if toc_level is not None:
+                # Promote bold text to heading
+                new_hashes = '#' * toc_level
+                line = f"{new_hashes} {text}"
         
-        # Post-process: Merge split headings
-        # We do this AFTER the loop because the loop might have promoted bold text (e.g. **1**)
-        # to headings (e.g. # 1), which our regex expects.
-        fixed_markdown = self._merge_split_headings(fixed_markdown)
+        return line
+    
+    def _fix_headings_without_toc(self, markdown: str, stats: Optional[dict] = None) -> str:
+        """Apply the non-TOC heading rules when the TOC is empty.
         
-        return fixed_markdown
+        Gives the same result as ``_fix_heading_line`` with no TOC match:
+        bold lines stay as they are and headings are bolded or cleaned
+        according to the config.
+        
+        Args:
+            markdown: Markdown with normalized line endings.
+            stats: Optional statistics dict updated in place.
+            
+        Returns:
+            The fixed markdown.
+        """
+        bold_headings = self.config.bold_non_toc_headings
+        remove_bold = self.config.remove_bold_from_headings
+        if stats is None and not (bold_headings or remove_bold):
+            return markdown
+        
+        def fix(match: re.Match) -> str:
+            hashes, heading_text = match.groups()
+            if stats is not None:
+                self._record_heading(stats, len(hashes), heading_text, None)
+            
+            clean_text = heading_text
+            if remove_bold:
+                clean_text = _RE_INNER_BOLD.sub(r'\1', clean_text).strip()
+            
+            if bold_headings:
+                return f"**{clean_text}**"
+            if remove_bold:
+                return f"{hashes} {clean_text}"
+            return match.group(0)
+        
+        return _RE_HEADING_LINE.sub(fix, markdown)
     
     def get_heading_statistics(self, markdown: str) -> dict:
         """Analyze headings in the markdown and compare to TOC.
         
+        Headings are counted as they appear in ``markdown``. The statistics
+        from ``fix_headings(markdown, collect_stats=True)`` describe the
+        headings after split headings are merged instead, and differ from
+        these when the input has any.
+        
         Args:
             markdown: The markdown content.
             
         Returns:
             Dict with statistics about heading matches.
         """
-        heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+        stats = self._empty_statistics()
+        
+        for match in _RE_HEADING.finditer(markdown):
+            heading_text = match.group(2)
+            toc_level = self._find_toc_level(heading_text)
+            self._record_heading(stats, len(match.group(1)), heading_text, toc_level)
         
-        stats = {
+        return stats
+    
+    @staticmethod
+    def _empty_statistics() -> dict:
+        """Create an empty heading statistics dict."""
+        return {
             "total_headings": 0,
             "matched_to_toc": 0,
             "level_corrections": 0,
             "unmatched": []
         }
+    
+    @staticmethod
+    def _record_heading(
+        stats: dict,
+        current_level: int,
+        heading_text: str,
+        toc_level: Optional[int]
+    ) -> None:
+        """Add one heading to a statistics dict."""
+        stats["total_headings"] += 1
         
-        for match in heading_pattern.finditer(markdown):
-            stats["total_headings"] += 1
-            current_level = len(match.group(1))
-            heading_text = match.group(2)
-            
-            toc_level = self._find_toc_level(heading_text)
-            
-            if toc_level is not None:
-                stats["matched_to_toc"] += 1
-                if toc_level != current_level:
-                    stats["level_corrections"] += 1
-            else:
-                # Only track first 10 unmatched
-                if len(stats["unmatched"]) < 10:
-                    stats["unmatched"].append(heading_text[:50])
-        
-        return stats
+        if toc_level is not None:
+            stats["matched_to_toc"] += 1
+            if toc_level != current_level:
+                stats["level_corrections"] += 1
+        else:
+            # Only track first 10 unmatched
+            if len(stats["unmatched"]) < 10:
+                stats["unmatched"].append(heading_text[:50])
 
 
 def create_heading_hierarchy(toc: list[TOCItem]) -> dict:
@@ -283,24 +471,33 @@ def create_heading_hierarchy(toc: list[TOCItem]) -> dict:
         Nested dict representing the TOC hierarchy.
     """
     root = {"children": [], "level": 0, "title": "root"}
-    stack = [root]
-    
-    for item in toc:
-        node = {
+    nodes = [
+        {
             "title": item.title,
             "level": item.level,
             "page": item.page_number,
             "children": []
         }
+        for item in toc
+    ]
+    
+    # Parallel stacks of open levels and their children lists
+    levels = [0]
+    children = [root["children"]]
+    
+    for node in nodes:
+        level = node["level"]
         
         # Pop stack until we find parent
-        while stack and stack[-1]["level"] >= item.level:
-            stack.pop()
+        while levels and levels[-1] >= level:
+            levels.pop()
+            children.pop()
         
         # Add as child of current top
-        if stack:
-            stack[-1]["children"].append(node)
+        if children:
+            children[-1].append(node)
         
-        stack.append(node)
+        levels.append(level)
+        children.append(node["children"])
     
     return root
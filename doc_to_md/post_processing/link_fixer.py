@@ -5,6 +5,28 @@ from dataclasses import dataclass
 from typing import Optional
 from urllib.parse import urlparse
 
+# Broken URL patterns (see _fix_broken_urls)
+# Line ends with a partial URL inside a markdown link
+_RE_OPEN_LINK = re.compile(r'\[[^\]]+\]\([^)]+$')
+# Same as _RE_OPEN_LINK applied to each line, for one scan of the document
+_RE_OPEN_LINK_LINE = re.compile(r'\[[^\]\n]+\]\([^)\n]+$', re.MULTILINE)
+# Line continues the URL and closes the link
+_RE_URL_CONTINUATION = re.compile(r'^[a-zA-Z0-9/\-_.?=&%#]+\)')
+# Markdown link target with an http(s) URL, split into scheme, network
+# location (up to the first "/", "?" or "#", as urlparse does) and the rest
+_RE_HTTP_TARGET = re.compile(r'\]\((https?://)([^/?#)]*)([^)]*)\)')
+# Characters urlparse strips or validates in a network location; hosts with
+# these (or non-ASCII ones) are left to urlparse
+_URLPARSE_SPECIAL = frozenset('[]\t\r\n')
+
+# Link syntax repairs (see _fix_markdown_links)
+# [ text ](url) -> [text](url)
+_RE_PADDED_BRACKETS = re.compile(r'\[\s+([^\]]+?)\s+\]')
+# [[text]](url) -> [text](url)
+_RE_DOUBLE_BRACKETS = re.compile(r'\[\[([^\]]+)\]\](\([^)]+\))')
+# [text(url) -> [text](url)
+_RE_MISSING_BRACKET = re.compile(r'\[([^\]]+)\(https?://([^)]+)\)')
+
 
 @dataclass
 class LinkFixerConfig:
@@ -46,6 +68,10 @@ class LinkFixer:
         Returns:
             Markdown with fixed links.
         """
+        # Every fix below needs a link bracket or a link target
+        if '[' not in markdown and '](http' not in markdown:
+            return markdown
+        
         result = markdown
         
         if self.config.fix_broken_urls:
@@ -71,27 +97,35 @@ class LinkFixer:
         # [text](http://example.
         # com/path)
         
-        lines = markdown.split('\n')
+        # Lines before the first open link are never joined, so only split
+        # from there on (most documents have none and are returned as-is)
+        first = _RE_OPEN_LINK_LINE.search(markdown)
+        if first is None:
+            return markdown
+        start = markdown.rfind('\n', 0, first.start()) + 1
+        
+        lines = markdown[start:].split('\n')
         result_lines = []
         i = 0
         
         while i < len(lines):
             line = lines[i]
             
-            # Check for broken markdown link
-            if i + 1 < len(lines):
-                # Pattern: ends with partial URL in link
-                if re.search(r'\[[^\]]+\]\([^)]+$', line):
-                    next_line = lines[i + 1].strip()
-                    # Next line continues the URL
-                    if re.match(r'^[a-zA-Z0-9/\-_.?=&%#]+\)', next_line):
-                        line = line + next_line
-                        i += 1
+            # Greedily extend the run: a joined continuation can itself end
+            # with another broken link, so keep joining until the line closes
+            # (previously only one continuation per run was ever joined)
+            while i + 1 < len(lines) and _RE_OPEN_LINK.search(line):
+                next_line = lines[i + 1].strip()
+                # Next line continues the URL
+                if not _RE_URL_CONTINUATION.match(next_line):
+                    break
+                line = line + next_line
+                i += 1
             
             result_lines.append(line)
             i += 1
         
-        return '\n'.join(result_lines)
+        return markdown[:start] + '\n'.join(result_lines)
     
     def _normalize_url_case(self, markdown: str) -> str:
         """Normalize URL hostnames to lowercase.
@@ -103,11 +137,17 @@ class LinkFixer:
             Markdown with normalized URLs.
         """
         def normalize_url(match):
-            url = match.group(1)
+            scheme, netloc, rest = match.groups()
+            if not netloc or netloc.islower():
+                return match.group(0)
+            if netloc.isascii() and _URLPARSE_SPECIAL.isdisjoint(netloc):
+                # Lowercase the hostname only
+                return f']({scheme}{netloc.lower()}{rest})'
+            
+            url = scheme + netloc + rest
             try:
                 parsed = urlparse(url)
                 if parsed.netloc:
-                    # Lowercase the hostname only
                     normalized = url.replace(
                         parsed.netloc,
                         parsed.netloc.lower(),
@@ -118,8 +158,11 @@ class LinkFixer:
                 pass
             return match.group(0)
         
+        if '](http' not in markdown:
+            return markdown
+        
         # Find markdown links and normalize
-        result = re.sub(r'\]\((https?://[^)]+)\)', normalize_url, markdown)
+        result = _RE_HTTP_TARGET.sub(normalize_url, markdown)
         
         return result
     
@@ -135,17 +178,15 @@ class LinkFixer:
         result = markdown
         
         # Fix spaces in link syntax: [ text ](url) -> [text](url)
-        result = re.sub(r'\[\s+([^\]]+?)\s+\]', r'[\1]', result)
+        result = _RE_PADDED_BRACKETS.sub(r'[\1]', result)
         
         # Fix double brackets: [[text]](url) -> [text](url)
-        result = re.sub(r'\[\[([^\]]+)\]\](\([^)]+\))', r'[\1]\2', result)
+        if '[[' in result:
+            result = _RE_DOUBLE_BRACKETS.sub(r'[\1]\2', result)
         
         # Fix missing closing bracket: [text(url) -> [text](url)
         # Only if it looks like a valid URL
-        result = re.sub(
-            r'\[([^\]]+)\(https?://([^)]+)\)',
-            r'[\1](https://\2)',
-            result
-        )
+        if '(http' in result:
+            result = _RE_MISSING_BRACKET.sub(r'[\1](https://\2)', result)
         
         return result
@@ -3,11 +3,156 @@
 import logging
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
+
+from .whitespace_normalizer import _RE_BLANK_RUN
 
 
 logger = logging.getLogger(__name__)
 
+# Common footer sections (matched case-insensitively as substrings)
+_COMMON_FOOTER_SECTIONS = (
+    'Contents', 'Overview of iDRAC', 'Logging in to iDRAC',
+    'Setting up managed system', 'Configuring iDRAC',
+    'Managing logs', 'Troubleshooting', 'Chapter', 'Rev.', 'Revision history',
+    'December 2025', 'Rev. A11'
+)
+_COMMON_FOOTER_SECTIONS_LOWER = {
+    common.lower(): common for common in _COMMON_FOOTER_SECTIONS
+}
+# One multi-literal scan over the lowercased footer text instead of a
+# substring test per section; the list can grow without extra passes
+_RE_COMMON_FOOTER = re.compile(
+    '|'.join(re.escape(common) for common in _COMMON_FOOTER_SECTIONS_LOWER)
+)
+
+# Blank line and list spacing patterns
+_RE_LIST_GAP = re.compile(
+    r'^([ \t]*[-*+]|\d+\.)[ \t]+(.*?)\n([ \t]*\n)+(?=[ \t]*([-*+]|\d+\.))',
+    re.MULTILINE
+)
+# The lookbehind anchors matches at the start of a whitespace run, so runs
+# inside a line are scanned once instead of once per character
+_RE_TRAILING_WS = re.compile(r'(?<![ \t])[ \t]+$', re.MULTILINE)
+
+# Bullet patterns. Characters: ●, ○, ■, •,  (common PDF artifact), and others
+_BULLET_CHARS = r'[●○■•▪‣⁃]'
+_RE_BULLET_CHAR = re.compile(_BULLET_CHARS)
+_RE_BULLET_BR = re.compile(rf'{_BULLET_CHARS}\s*(?:<br/?>\s*)+')
+_RE_BULLET_SPACE = re.compile(rf'(^|[| \t]){_BULLET_CHARS}[ \t]*', re.MULTILINE)
+_RE_DOUBLE_BULLET = re.compile(r'^- +- ', re.MULTILINE)
+_RE_TABLE_DOUBLE_BULLET = re.compile(r'\| +- +- ')
+
+# Page footer and page number patterns, each matched against a single line
+_RE_FOOTER_TEXT_NUMBER = re.compile(r'^\s*\*\*(.*?)\*\*\s+\*\*(\d{1,4})\*\*\s*$')  # **Text** **23**
+_RE_FOOTER_NUMBER_TEXT = re.compile(r'^\s*\*\*(\d{1,4})\*\*\s+\*\*(.*?)\*\*\s*$')  # **23** **Text**
+_RE_BOLD_PAGE_NUMBER = re.compile(r'^\s*\*\*\d{1,4}\*\*\s*$')                        # **23**
+
+# Formatting patterns
+_RE_DOUBLE_BOLD = re.compile(r'\*{4,}([^*]+)\*{4,}')
+_RE_HR = re.compile(r'^[\-_\*]{3,}\s*$', re.MULTILINE)
+_HR_CHARS = ('-', '_', '*')
+
+# Physical TOC patterns (at least 5 dots as a leader)
+_RE_TOC_LINE = re.compile(r'^.*?\.\.\.\.\.+.*?\d+.*$', re.MULTILINE)
+_RE_BOLD_BLOCK = re.compile(r'\*\*.*?\*\*', re.DOTALL)
+_RE_DIGIT = re.compile(r'\d')
+
+# First characters of lines that start a markdown block (headings, lists,
+# tables, quotes) and are never joined as broken sentences
+_BLOCK_START_CHARS = frozenset('#-|>')
+
+# Characters of input split into lines at once by the line pass (see _iter_lines)
+_LINE_BLOCK_SIZE = 1 << 20
+
+
+def _iter_lines(text: str, block_size: int = _LINE_BLOCK_SIZE) -> Iterator[str]:
+    """Yield the lines of ``text`` like ``text.split('\\n')``, block by block.
+    
+    Only one block of roughly ``block_size`` characters is split into a line
+    list at a time, instead of the whole document.
+    """
+    start = 0
+    while len(text) - start > block_size:
+        end = text.find('\n', start + block_size)
+        if end < 0:
+            break
+        yield from text[start:end].split('\n')
+        start = end + 1
+    yield from text[start:].split('\n')
+
+
+def _drop_artifact_lines(
+    lines: Iterable[str],
+    is_artifact: Callable[[str], Optional[bool]],
+    drop_blanks_before: bool = True
+) -> Iterator[str]:
+    """Replace artifact lines and the blank lines around them with one blank line.
+    
+    Gives the same lines as the document-wide ``^\\s*ARTIFACT\\s*$``
+    (MULTILINE) substitutions this replaces, whose ``\\s*`` also consumed
+    the surrounding blank lines: an artifact and the blank lines after it
+    become a single empty line, as do the blank lines before it unless
+    ``drop_blanks_before`` is False (for patterns without a leading
+    ``\\s*``). Artifacts separated only by blank lines share that empty line
+    when the last of those lines is empty; whitespace there stopped the next
+    match from starting early. A line the pattern matched but kept had
+    already consumed the blank lines after it, so those stay even if an
+    artifact follows them.
+    
+    Args:
+        lines: Markdown lines (without line endings).
+        is_artifact: For a non-blank line, True if it is an artifact to
+            remove, None if it has an artifact's shape but is kept, and False
+            otherwise.
+        drop_blanks_before: Whether blank lines before an artifact go too.
+        
+    Yields:
+        The remaining lines, in order.
+    """
+    pending: list[str] = []  # blank lines not yet known to be kept
+    after_artifact = False   # only blank lines since the last artifact
+    last_blank = None        # the last blank line since that artifact
+    kept_match = False       # pending follows a matched line that was kept
+    for line in lines:
+        if not line.strip():
+            if after_artifact:
+                last_blank = line
+            else:
+                pending.append(line)
+            continue
+        
+        verdict = is_artifact(line)
+        if verdict:
+            if not after_artifact:
+                if kept_match:
+                    # An empty last blank line takes the artifact's place
+                    yield from pending
+                    if not pending or pending[-1]:
+                        yield ''
+                else:
+                    if not drop_blanks_before:
+                        yield from pending
+                    yield ''
+                pending = []
+            elif not (drop_blanks_before and last_blank == ''):
+                yield ''
+            after_artifact = True
+            last_blank = None
+            kept_match = False
+            continue
+        
+        if pending:
+            yield from pending
+            pending = []
+        after_artifact = False
+        kept_match = verdict is None
+        yield line
+    
+    # Blank lines after a final artifact are consumed too
+    if not after_artifact:
+        yield from pending
+
 
 @dataclass
 class CleanupConfig:
@@ -28,6 +173,9 @@ class CleanupConfig:
     trim_trailing_whitespace: bool = True
     # Remove redundant physical TOC pages
     remove_redundant_toc: bool = True
+    # Collapse runs of blank lines into one, like WhitespaceNormalizer
+    # (lets the pipeline skip the separate whitespace pass)
+    collapse_blank_lines: bool = False
 
 
 class MarkdownCleanup:
@@ -52,50 +200,108 @@ class MarkdownCleanup:
     def clean(self, markdown: str) -> str:
         """Run all cleanup steps on markdown content.
         
+        Page footers, page numbers and leftover dot-leader lines are removed
+        line by line, together with the blank lines around them. A footer or a ``****double bold****`` run
+        split across lines is no longer matched as a whole: for example
+        ``"**Contents**\\n**5**"`` only loses the ``**5**`` line.
+        
         Args:
             markdown: The markdown content to clean.
             
         Returns:
             Cleaned markdown content.
         """
+        # Normalize line endings once for all steps
         result = markdown
+        if '\r' in result:
+            result = result.replace('\r\n', '\n').replace('\r', '\n')
         
-        # Step 1: Remove page footers (e.g., "**Contents** **5**")
-        if self.config.remove_page_footers:
-            result = self._remove_page_footers(result)
-        
-        # Step 2: Remove orphan page numbers
-        if self.config.remove_orphan_page_numbers:
-            result = self._remove_orphan_page_numbers(result)
-        
-        # Step 3: Fix broken sentences
-        if self.config.fix_broken_sentences:
-            result = self._fix_broken_sentences(result)
+        # Steps 1-6: Page footers, orphan page numbers, broken sentences, bold,
+        # horizontal rules and trailing whitespace in a single pass over the lines.
+        # Lines are split block by block so large documents are never held
+        # as a full line list next to the cleaned copy
+        result = '\n'.join(self._clean_lines(_iter_lines(result)))
         
-        # Step 4: Clean up excessive bold
-        if self.config.cleanup_bold:
-            result = self._cleanup_bold(result)
-        
-        # Step 5: Normalize horizontal rules
-        if self.config.normalize_hr:
-            result = self._normalize_hr(result)
-        
-        # Step 6: Trim trailing whitespace
-        if self.config.trim_trailing_whitespace:
-            result = self._trim_trailing_whitespace(result)
-        
-        # Step 7: Remove redundant TOC
-        if self.config.remove_redundant_toc:
+        # Step 7: Remove redundant TOC (every TOC pattern needs a dot leader)
+        if self.config.remove_redundant_toc and '.....' in result:
             result = self._remove_redundant_toc(result)
         
         # Step 8: Normalize bullets
         result = self._normalize_bullets(result)
         
-        # Step 8: Normalize blank lines (do this last)
+        # Step 9: Normalize blank lines (do this last)
         result = self._normalize_blank_lines(result)
         
         return result
     
+    def _clean_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """Apply the line-level cleanup steps in one pass.
+        
+        Each line has page artifacts removed first, so sentence joining
+        looks at the already cleaned next line.
+        
+        Args:
+            lines: Markdown lines (without line endings).
+            
+        Yields:
+            The cleaned lines, in order.
+        """
+        # Page footers and page numbers, in the order the former document-wide
+        # substitutions ran; each stage sees the lines the previous one left
+        cleaned = iter(lines)
+        if self.config.remove_page_footers:
+            cleaned = _drop_artifact_lines(cleaned, self._is_text_number_footer)
+            cleaned = _drop_artifact_lines(cleaned, self._is_number_text_footer)
+            cleaned = _drop_artifact_lines(cleaned, self._is_bold_page_number)
+        if self.config.remove_orphan_page_numbers:
+            cleaned = _drop_artifact_lines(
+                cleaned, self._is_orphan_page_number, drop_blanks_before=False
+            )
+        
+        fixed = self._fix_broken_lines(cleaned) if self.config.fix_broken_sentences else cleaned
+        
+        after_hr = False
+        for line in fixed:
+            # Fix double-bolded text: ****text**** -> **text**
+            if self.config.cleanup_bold and '****' in line:
+                line = _RE_DOUBLE_BOLD.sub(r'**\1**', line)
+            
+            if self.config.normalize_hr:
+                # Blank lines right after a horizontal rule are dropped
+                if after_hr and not line.strip():
+                    continue
+                # Normalize various HR formats to ---
+                after_hr = line.startswith(_HR_CHARS) and _RE_HR.match(line) is not None
+                if after_hr:
+                    line = '---'
+            
+            if self.config.trim_trailing_whitespace:
+                line = line.rstrip()
+            yield line
+    
+    def _fix_broken_lines(self, lines: Iterator[str]) -> Iterator[str]:
+        """Fix sentences broken across lines by PDF extraction.
+        
+        Args:
+            lines: Markdown lines (without line endings).
+            
+        Yields:
+            Lines with word breaks joined; a joined line is left empty.
+        """
+        line = next(lines, None)
+        if line is None:
+            return
+        
+        for next_line in lines:
+            if self._joins_next_line(line, next_line):
+                # Remove hyphen and join
+                line = line.rstrip()[:-1] + next_line.strip()
+                next_line = ''
+            yield line
+            line = next_line
+        
+        yield line
+    
     def _normalize_blank_lines(self, markdown: str) -> str:
         """Reduce consecutive blank lines and clean up list spacing.
         
@@ -112,14 +318,21 @@ class MarkdownCleanup:
         # 1. Tighten list spacing
         # Remove blank lines between list items to make them "tight" lists
         # Normalize list items:
-        result = re.sub(r'^([ \t]*[-*+]|\d+\.)[ \t]+(.*?)\n([ \t]*\n)+(?=[ \t]*([-*+]|\d+\.))', r'\1 \2\n', result, flags=re.MULTILINE)
+        result = _RE_LIST_GAP.sub(r'\1 \2\n', result)
         
-        # 2. Also clean up trailing whitespace on all lines
-        result = re.sub(r'[ \t]+$', '', result, flags=re.MULTILINE)
+        # 2. Also clean up trailing whitespace on all lines. Lines were already
+        # trimmed in the line pass, so only scan if a later step left some
+        # (the end of the document is handled by rstrip below)
+        if ' \n' in result or '\t\n' in result:
+            result = _RE_TRAILING_WS.sub('', result)
         
         # Remove blank lines at start of document
         result = result.lstrip('\n')
         
+        # Collapse blank line runs here instead of in a separate pass
+        if self.config.collapse_blank_lines:
+            result = _RE_BLANK_RUN.sub('\n\n', result)
+        
         # Ensure single newline at end
         result = result.rstrip() + '\n'
         
@@ -138,260 +351,143 @@ class MarkdownCleanup:
         """
         result = markdown
         
-        # Pattern for common bullet characters followed by optional <br> and whitespace
-        # Characters: ●, ○, ■, •,  (common PDF artifact), and others
-        bullet_chars = r'[●○■•▪‣⁃]'
-        
-        # 1. Handle Bullet<br>Text or Bullet <br> Text
-        # Replace with "- "
-        result = re.sub(rf'{bullet_chars}\s*(?:<br/?>\s*)+', r'- ', result)
-        
-        # 2. Handle Bullet followed by just space
-        # Ensuring we don't double up or replace existing good bullets
-        # Use a lookahead to ensure it's at start of line or after a pipe (table) or space
-        result = re.sub(rf'(^|[| \t]){bullet_chars}[ \t]*', r'\1- ', result, flags=re.MULTILINE)
-        
-        # 3. Clean up any resulting "- - " or similar dups (from double matching)
-        result = re.sub(r'^- +- ', r'- ', result, flags=re.MULTILINE)
-        result = re.sub(r'\| +- +- ', r'| - ', result)
-        
-        return result
-    
-    def _remove_page_footers(self, markdown: str) -> str:
-        """Remove page number footers from PDF conversion.
-        
-        Matches patterns like:
-        - "**Contents** **5**"
-        - "**Overview of iDRAC** **23**"
-        - "**12** **Contents**"
-        - "**24** **Overview of iDRAC**"
-        
-        Args:
-            markdown: Input markdown.
+        # Steps 1 and 2 only apply if a bullet character is present at all.
+        # The bullet characters are all non-ASCII, and isascii() is O(1)
+        if not result.isascii() and _RE_BULLET_CHAR.search(result):
+            # 1. Handle Bullet<br>Text or Bullet <br> Text
+            # Replace with "- "
+            result = _RE_BULLET_BR.sub(r'- ', result)
             
-        Returns:
-            Markdown with page footers removed.
-        """
-        result = markdown
-        
-        # Normalize line endings first to simplify regex
-        result = result.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Common footer sections
-        common_sections = [
-            'Contents', 'Overview of iDRAC', 'Logging in to iDRAC',
-            'Setting up managed system', 'Configuring iDRAC',
-            'Managing logs', 'Troubleshooting', 'Chapter', 'Rev.', 'Revision history',
-            'December 2025', 'Rev. A11'
-        ]
-
-        def footer_callback(match):
-            full_match = match.group(0)
-            
-            # Check which group matched (named groups from pattern)
-            # We use non-greedy matches, so we need to be careful
-            
-            # Since we will use two separate patterns, we expect specific group names
-            # or we can use numerical groups corresponding to the active pattern.
-            
-            # Actually, `re.sub` takes a callback. The callback receives the match object.
-            # If we use different patterns, the group indices might differ.
-            # Let's handle generic groups.
-            
-            groups = match.groups()
-            # We expect 2 groups: Text and Number (in either order)
-            # But the regex might capture them.
-            
-            # To simplify, we will parse the text and number from the FULL MATCH string
-            # because the regex ensures the structure **T** **N** or **N** **T**.
-            # This avoids group index confusion.
-            
-            # Remove all asterisks to get raw content
-            raw = full_match.replace('*', '').strip()
-            # Split by sufficient whitespace?
-            # Re-match with a simple local regex to extract parts
-            
-            # Actually, let's trust the match groups if we name them consistently in the regex calls.
-            
-            text = None
-            num = None
-            
-            # Try to identify text vs number
-            # Assuming one group is digits, one is text.
-            g1, g2 = groups
-            
-            if g1.isdigit() and not g2.isdigit():
-                 num = g1
-                 text = g2
-            elif g2.isdigit() and not g1.isdigit():
-                 num = g2
-                 text = g1
-            else:
-                 # Both digits or neither? check logic
-                 if g1.strip().isdigit(): num = g1; text = g2
-                 elif g2.strip().isdigit(): num = g2; text = g1
-            
-            if not text or not num:
-                 return full_match # Should not happen with our regex
-            
-            clean_text = text.strip()
-            
-            should_remove = False
-            
-            # Check common sections
-            for common in common_sections:
-                if common.lower() in clean_text.lower():
-                    should_remove = True
-                    logger.debug(f"Removing Footer (Common: {common}): '{clean_text}' '{num}'")
-                    break
-            
-            if not should_remove:
-                # Check for short, seemingly generic footers
-                # e.g. "iDRAC9 User's Guide" (if it repeats) or pure dates?
-                if len(clean_text) < 50:
-                    should_remove = True
-                    logger.debug(f"Removing Footer (Generic < 50 chars): '{clean_text}' '{num}'")
-            
-            if should_remove:
-                return ''
-            
-            return full_match
-
-        logger.debug("Starting Unified Footer Removal")
-        
-        # Pattern A: **Text** **Number**
-        # Regex: ^\s*\*\*(.*?)\*\*\s+\*\*(\d{1,4})\*\*\s*$
-        result = re.sub(
-            r'^\s*\*\*(.*?)\*\*\s+\*\*(\d{1,4})\*\*\s*$',
-            footer_callback,
-            result,
-            flags=re.MULTILINE
-        )
-
-        # Pattern B: **Number** **Text**
-        # Regex: ^\s*\*\*(\d{1,4})\*\*\s+\*\*(.*?)\*\*\s*$
-        result = re.sub(
-             r'^\s*\*\*(\d{1,4})\*\*\s+\*\*(.*?)\*\*\s*$',
-             footer_callback,
-             result,
-             flags=re.MULTILINE
-        )
-
-        # Pattern 3: Just bold page numbers on their own line
-        # Example: **23**
-        result_prev = result
-        result = re.sub(
-            r'^\s*\*\*\d{1,4}\*\*\s*$',
-            '',
-            result,
-            flags=re.MULTILINE
-        )
-        if result != result_prev:
-             pass # Removed standalone page numbers
+            # 2. Handle Bullet followed by just space
+            # Ensuring we don't double up or replace existing good bullets
+            # Use a lookahead to ensure it's at start of line or after a pipe (table) or space
+            result = _RE_BULLET_SPACE.sub(r'\1- ', result)
+        
+        # 3. Clean up any resulting "- - " or similar dups (from double matching),
+        # in list lines and table cells. Both patterns need "-" followed by
+        # spaces and another "-", so two substring checks rule them out cheaply
+        if '- -' in result or '-  ' in result:
+            result = _RE_DOUBLE_BULLET.sub(r'- ', result)
+            result = _RE_TABLE_DOUBLE_BULLET.sub(r'| - ', result)
         
         return result
     
-    def _remove_orphan_page_numbers(self, markdown: str) -> str:
-        """Remove standalone page numbers that aren't part of content.
+    def _is_text_number_footer(self, line: str) -> Optional[bool]:
+        """Check for a page footer like "**Contents** **5**".
         
-        Args:
-            markdown: Input markdown.
-            
         Returns:
-            Markdown with orphan page numbers removed.
+            True for a footer, None for a line of that shape that is kept,
+            False for any other line (see _drop_artifact_lines).
         """
-        # Remove lines that are just a number (page number)
-        result = re.sub(r'^\d{1,4}\s*$', '', markdown, flags=re.MULTILINE)
-        
-        return result
+        # Every footer form is bold, so lines without '**' are skipped early
+        if '**' not in line:
+            return False
+        match = _RE_FOOTER_TEXT_NUMBER.match(line)
+        return (self._is_page_footer(*match.groups()) or None) if match else False
     
-    def _fix_broken_sentences(self, markdown: str) -> str:
-        """Fix sentences broken across lines by PDF extraction.
-        
-        Joins lines where a sentence continues but was split by PDF layout.
-        
-        Args:
-            markdown: Input markdown.
-            
-        Returns:
-            Markdown with fixed sentences.
-        """
-        lines = markdown.split('\n')
-        result_lines = []
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i]
-            
-            # Skip empty lines, headings, list items, tables, code blocks
-            if (not line.strip() or 
-                line.strip().startswith('#') or
-                line.strip().startswith('-') or
-                line.strip().startswith('*') and not line.strip().startswith('**') or
-                line.strip().startswith('|') or
-                line.strip().startswith('```') or
-                line.strip().startswith('>')):
-                result_lines.append(line)
-                i += 1
-                continue
-            
-            # Check if line ends mid-sentence (no terminal punctuation)
-            # and next line continues the sentence
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                
-                # Skip if next line is empty or special
-                if (next_line and 
-                    not next_line.startswith('#') and
-                    not next_line.startswith('-') and
-                    not next_line.startswith('|') and
-                    not next_line.startswith('```') and
-                    not next_line.startswith('>')):
-                    
-                    # If current line ends with hyphen (word break), join
-                    if line.rstrip().endswith('-') and next_line[0].islower():
-                        # Remove hyphen and join
-                        line = line.rstrip()[:-1] + next_line
-                        lines[i + 1] = ''  # Clear the joined line
-            
-            result_lines.append(line)
-            i += 1
-        
-        return '\n'.join(result_lines)
+    def _is_number_text_footer(self, line: str) -> Optional[bool]:
+        """Check for a page footer like "**12** **Contents**", see _is_text_number_footer."""
+        if '**' not in line:
+            return False
+        match = _RE_FOOTER_NUMBER_TEXT.match(line)
+        return (self._is_page_footer(*match.groups()) or None) if match else False
+    
+    @staticmethod
+    def _is_bold_page_number(line: str) -> bool:
+        """Check for a bold page number on its own line, like "**23**"."""
+        return '**' in line and _RE_BOLD_PAGE_NUMBER.match(line) is not None
+    
+    @staticmethod
+    def _is_orphan_page_number(line: str) -> bool:
+        """Check for a line that is just a page number, like "23"."""
+        number = line.rstrip()
+        return len(number) <= 4 and number.isdecimal()
     
-    def _cleanup_bold(self, markdown: str) -> str:
-        """Clean up excessive or malformed bold formatting.
+    def _is_page_footer(self, g1: str, g2: str) -> bool:
+        """Decide whether a bold text/number pair is a page footer.
         
         Args:
-            markdown: Input markdown.
+            g1: First bold part of the line.
+            g2: Second bold part of the line.
             
         Returns:
-            Markdown with cleaned bold formatting.
+            True if the line should be removed.
         """
-        # Remove bold from entire lines that are just bold
-        # (often page headers/footers)
-        result = markdown
-        
-        # Fix double-bolded text: ****text**** -> **text**  
-        result = re.sub(r'\*{4,}([^*]+)\*{4,}', r'**\1**', result)
-        
-        # Remove bold from very short standalone bold text that looks like artifacts
-        # But be careful not to remove legitimate bold text
-        
-        return result
+        text = None
+        num = None
+        
+        # Try to identify text vs number
+        # Assuming one group is digits, one is text.
+        if g1.isdigit() and not g2.isdigit():
+            num = g1
+            text = g2
+        elif g2.isdigit() and not g1.isdigit():
+            num = g2
+            text = g1
+        elif g1.strip().isdigit():
+            num = g1
+            text = g2
+        elif g2.strip().isdigit():
+            num = g2
+            text = g1
+        
+        if not text or not num:
+            return False
+        
+        clean_text = text.strip()
+        
+        # Check common sections
+        match = _RE_COMMON_FOOTER.search(clean_text.lower())
+        if match:
+            common = _COMMON_FOOTER_SECTIONS_LOWER[match.group(0)]
+            logger.debug(f"Removing Footer (Common: {common}): '{clean_text}' '{num}'")
+            return True
+        
+        # Check for short, seemingly generic footers
+        # e.g. "iDRAC9 User's Guide" (if it repeats) or pure dates?
+        if len(clean_text) < 50:
+            logger.debug(f"Removing Footer (Generic < 50 chars): '{clean_text}' '{num}'")
+            return True
+        
+        return False
     
-    def _normalize_hr(self, markdown: str) -> str:
-        """Normalize horizontal rules to consistent format.
+    def _joins_next_line(self, line: str, next_line: str) -> bool:
+        """Check if a sentence broken by PDF layout continues on the next line.
+        
+        Only a word break (line ending with a hyphen followed by a lowercase
+        continuation) is joined.
         
         Args:
-            markdown: Input markdown.
+            line: The current line.
+            next_line: The following line.
             
         Returns:
-            Markdown with normalized horizontal rules.
+            True if the two lines should be joined.
         """
-        # Normalize various HR formats to ---
-        result = re.sub(r'^[\-_\*]{3,}\s*$', '---', markdown, flags=re.MULTILINE)
-        return result
+        stripped = line.strip()
+        
+        # Skip empty lines, headings, list items, tables, code blocks
+        if not stripped:
+            return False
+        first = stripped[0]
+        if (first in _BLOCK_START_CHARS or
+                first == '*' and not stripped.startswith('**') or
+                first == '`' and stripped.startswith('```')):
+            return False
+        
+        # If current line ends with hyphen (word break), join
+        if not stripped.endswith('-'):
+            return False
+        
+        # Skip if next line is empty or special
+        next_stripped = next_line.strip()
+        if not next_stripped:
+            return False
+        first = next_stripped[0]
+        if first in _BLOCK_START_CHARS or first == '`' and next_stripped.startswith('```'):
+            return False
+        
+        return first.islower()
     
     def _remove_redundant_toc(self, markdown: str) -> str:
         """Remove redundant physical TOC pages.
@@ -407,11 +503,6 @@ class MarkdownCleanup:
         Returns:
             Markdown with redundant TOC lines removed.
         """
-        # Global pattern for any line containing dot leaders and a page number anywhere
-        # This handles merged entries or entries with trailing text.
-        # We look for at least 5 dots.
-        toc_pattern = re.compile(r'^.*?\.\.\.\.\.+.*?\d+.*$', re.MULTILINE)
-        
         # Also handle bold blocks that contain dot leaders
         # Some TOC pages are entirely wrapped in bold.
         def aggressive_toc_callback(match):
@@ -419,42 +510,31 @@ class MarkdownCleanup:
             # If the block has a dot leader sequence, it's likely part of a TOC
             if '.....' in text:
                 # If it also contains a number (page number), we remove it
-                if re.search(r'\d+', text):
+                if _RE_DIGIT.search(text):
                     logger.debug(f"Removing TOC-like block: {repr(text[:50])}...")
                     return ""
             return text
 
-        # Apply callback to both bold blocks and orphan lines
-        result = toc_pattern.sub('', markdown)
+        # Global pattern for any line containing dot leaders and a page number anywhere
+        # This handles merged entries or entries with trailing text.
+        result = _RE_TOC_LINE.sub('', markdown)
         
         # Handle the specific multi-title bold block with internal dots
-        result = re.sub(r'\*\*.*?\*\*', aggressive_toc_callback, result, flags=re.DOTALL)
+        result = _RE_BOLD_BLOCK.sub(aggressive_toc_callback, result)
         
-        # Final cleanup for residual dot lines that might not have numbers but are garbage
-        result = re.sub(r'^\s*\.\.\.\.\.\.+\s*$', '', result, flags=re.MULTILINE)
+        # Final cleanup of residual dot lines that might not have numbers but
+        # are garbage, together with the blank lines around them
+        lines = _drop_artifact_lines(result.split('\n'), self._is_dot_line)
         
         # Handle cases where dots and numbers are not in bold but are on same line
         # e.g. "Some Title................................ 10 More Title................................ 11"
-        def merge_cleaner(line):
-            if '.....' in line and re.search(r'\d+', line):
-                return ""
-            return line
-            
-        lines = result.split('\n')
-        result_lines = [merge_cleaner(l) for l in lines]
-        result = '\n'.join(result_lines)
-        
-        return result
+        return '\n'.join(
+            '' if '.....' in line and _RE_DIGIT.search(line) else line
+            for line in lines
+        )
     
-    def _trim_trailing_whitespace(self, markdown: str) -> str:
-        """Remove trailing whitespace from each line.
-        
-        Args:
-            markdown: Input markdown.
-            
-        Returns:
-            Markdown with trimmed lines.
-        """
-        lines = markdown.split('\n')
-        trimmed = [line.rstrip() for line in lines]
-        return '\n'.join(trimmed)
+    @staticmethod
+    def _is_dot_line(line: str) -> bool:
+        """Check for a line of nothing but dots (at least six)."""
+        dots = line.strip()
+        return len(dots) >= 6 and not dots.strip('.')
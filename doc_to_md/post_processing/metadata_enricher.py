@@ -1,10 +1,10 @@
 """Metadata enricher for RAG-optimized chunk metadata."""
 
-import re
 from dataclasses import dataclass
 from typing import Optional
 
 from ..processing.models import Chunk, ContentType, DocumentMetadata
+from .whitespace_normalizer import _RE_BLANK_RUN
 
 
 @dataclass
@@ -107,7 +107,7 @@ class MetadataEnricher:
             lines.append(f'following_section: "{chunk.following_section}"')
         
         # Content metadata
-        lines.append(f"content_type: {chunk.content_type.value}")
+        lines.append(f"content_type: {chunk.content_type}")
         lines.append(f"has_tables: {str(chunk.has_tables).lower()}")
         lines.append(f"has_code_blocks: {str(chunk.has_code_blocks).lower()}")
         
@@ -233,4 +233,4 @@ def generate_markdown_output(
     raw_markdown = "\n\n".join(output_parts)
     
     # Final cleanup of any accidental triple newlines created by the join
-    return re.sub(r'\n([ \t]*\n){2,}', '\n\n', raw_markdown)
+    return _RE_BLANK_RUN.sub('\n\n', raw_markdown)
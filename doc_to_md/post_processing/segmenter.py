@@ -1,11 +1,28 @@
 """Structure-aware content segmenter for RAG-optimized chunking."""
 
 import re
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
-from ..processing.models import Chunk, ContentType, Section, TOCItem
-from .toc_processor import TOCProcessor
+from ..processing.models import _RE_TABLE, Chunk, ContentType, Section, TOCItem
+from .toc_processor import _RE_HEADING, TOCProcessor
+
+
+# Header row followed by a separator row, enough to detect a table
+_RE_TABLE_HEADER = re.compile(r'\|.+\|\n\|[-:\| ]+\|')
+# Placeholders for protected elements, e.g. "__TABLE_0__"
+_RE_PLACEHOLDER = re.compile(r'__[A-Z]+_\d+__')
+# Content that is only a single heading line (matched against stripped content)
+_RE_HEADING_ONLY = re.compile(r'^#{1,6}\s+.+$')
+# Fenced code block
+_RE_CODE_BLOCK = re.compile(r'```[\s\S]*?```')
+# Any line with pipes on both sides of some text
+_RE_TABLE_ROW = re.compile(r'\|.+\|')
+_RE_PARAGRAPH_BREAK = re.compile(r'\n\n+')
+# List item lines, used to detect list content
+_RE_BULLET_ITEM = re.compile(r'^[\s]*[-*+]\s', re.MULTILINE)
+_RE_NUMBERED_ITEM = re.compile(r'^[\s]*\d+\.\s', re.MULTILINE)
 
 
 @dataclass
@@ -21,6 +38,14 @@ class SegmenterConfig:
     preserve_tables: bool = True
     # Keep code blocks as single chunks
     preserve_code_blocks: bool = True
+    # Unit of the chunk sizes: "chars", or "bytes" to budget by UTF-8 size,
+    # which tracks embedding token counts more closely for non-ASCII text
+    size_unit: str = "chars"
+
+
+def _utf8_len(text: str) -> int:
+    """Length of text in UTF-8 bytes, without encoding ASCII-only text."""
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
 
 
 class StructureAwareSegmenter:
@@ -46,6 +71,12 @@ class StructureAwareSegmenter:
         """
         self.toc_processor = toc_processor
         self.config = config or SegmenterConfig()
+        if self.config.size_unit == "chars":
+            self._measure = len
+        elif self.config.size_unit == "bytes":
+            self._measure = _utf8_len
+        else:
+            raise ValueError(f"Unknown size unit: {self.config.size_unit}")
     
     def segment(self, markdown: str) -> list[Chunk]:
         """Segment markdown content into RAG-optimized chunks.
@@ -95,10 +126,8 @@ class StructureAwareSegmenter:
         """
         sections = []
         
-        # Pattern to match markdown headings
-        heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
-        
-        matches = list(heading_pattern.finditer(markdown))
+        # Match markdown headings
+        matches = list(_RE_HEADING.finditer(markdown))
         
         if not matches:
             # No headings found, treat entire content as one section
@@ -114,7 +143,8 @@ class StructureAwareSegmenter:
         
         for i, match in enumerate(matches):
             level = len(match.group(1))
-            title = match.group(2).strip()
+            # Interned so repeated titles share one string across chunk paths
+            title = sys.intern(match.group(2).strip())
             
             # Determine content end
             content_start = match.end()
@@ -160,14 +190,14 @@ class StructureAwareSegmenter:
             List of Chunk objects.
         """
         # Detect content types
-        has_tables = bool(re.search(r'\|.+\|', content))
-        has_code = bool(re.search(r'```[\s\S]*?```', content))
+        has_tables = bool(_RE_TABLE_ROW.search(content))
+        has_code = bool(_RE_CODE_BLOCK.search(content))
         
         # Determine primary content type
         content_type = self._detect_content_type(content)
         
         # If content is small enough, return as single chunk
-        if len(content) <= self.config.max_chunk_size:
+        if self._measure(content) <= self.config.max_chunk_size:
             return [Chunk(
                 content=content,
                 section_path=path + [title],
@@ -210,31 +240,24 @@ class StructureAwareSegmenter:
         
         # Protect tables
         if self.config.preserve_tables:
-            table_pattern = re.compile(
-                r'(\|[^\n]+\|\n\|[-:\| ]+\|\n(?:\|[^\n]+\|\n)*)',
-                re.MULTILINE
+            working_content = self._protect_matches(
+                _RE_TABLE, working_content, "TABLE", ContentType.TABLE, protected_elements
             )
-            for i, match in enumerate(table_pattern.finditer(content)):
-                placeholder = f"__TABLE_{i}__"
-                protected_elements.append((placeholder, match.group(1), ContentType.TABLE))
-                working_content = working_content.replace(match.group(1), placeholder)
         
         # Protect code blocks
         if self.config.preserve_code_blocks:
-            code_pattern = re.compile(r'```[\s\S]*?```')
-            for i, match in enumerate(code_pattern.finditer(working_content)):
-                placeholder = f"__CODE_{i}__"
-                protected_elements.append((placeholder, match.group(0), ContentType.CODE_BLOCK))
-                working_content = working_content.replace(match.group(0), placeholder)
+            working_content = self._protect_matches(
+                _RE_CODE_BLOCK, working_content, "CODE", ContentType.CODE_BLOCK, protected_elements
+            )
         
         # Split by paragraphs
-        paragraphs = re.split(r'\n\n+', working_content)
+        paragraphs = _RE_PARAGRAPH_BREAK.split(working_content)
         
         current_chunk = []
         current_size = 0
         
         for para in paragraphs:
-            para_size = len(para)
+            para_size = self._measure(para)
             
             # Check if this is a protected element
             is_protected = any(p[0] == para.strip() for p in protected_elements)
@@ -296,15 +319,59 @@ class StructureAwareSegmenter:
         
         return chunks
     
+    def _protect_matches(
+        self,
+        pattern: re.Pattern,
+        content: str,
+        kind: str,
+        content_type: ContentType,
+        protected_elements: list[tuple[str, str, ContentType]]
+    ) -> str:
+        """Replace every match of pattern with a numbered placeholder.
+        
+        The replacement is spliced at the match positions, so the content
+        is copied once no matter how many elements are protected.
+        
+        Args:
+            pattern: Pattern matching the atomic elements.
+            content: Content to protect elements in.
+            kind: Placeholder name, e.g. "TABLE" for "__TABLE_0__".
+            content_type: Content type recorded for the elements.
+            protected_elements: List the (placeholder, original, type)
+                entries are appended to.
+            
+        Returns:
+            Content with placeholders in place of the elements.
+        """
+        parts = []
+        pos = 0
+        for i, match in enumerate(pattern.finditer(content)):
+            placeholder = f"__{kind}_{i}__"
+            # Store the element with any earlier placeholders inside it restored
+            original = self._restore_protected(match.group(0), protected_elements)
+            protected_elements.append((placeholder, original, content_type))
+            parts.append(content[pos:match.start()])
+            parts.append(placeholder)
+            pos = match.end()
+        parts.append(content[pos:])
+        return ''.join(parts)
+    
     def _restore_protected(
         self,
         content: str,
         protected_elements: list[tuple[str, str, ContentType]]
     ) -> str:
         """Restore protected elements in content."""
-        for placeholder, original, _ in protected_elements:
-            content = content.replace(placeholder, original)
-        return content
+        if not protected_elements:
+            return content
+        
+        originals = {placeholder: original for placeholder, original, _ in protected_elements}
+        
+        def restore(match: re.Match) -> str:
+            return originals.get(match.group(0), match.group(0))
+        
+        # Single scan over the content for all placeholders
+        return _RE_PLACEHOLDER.sub(restore, content)
     
     def _create_chunk(
         self,
@@ -333,23 +400,23 @@ class StructureAwareSegmenter:
     def _detect_content_type(self, content: str) -> ContentType:
         """Detect the primary content type of a text block."""
         # Check for tables
-        if re.search(r'\|.+\|\n\|[-:\| ]+\|', content):
+        if _RE_TABLE_HEADER.search(content):
             return ContentType.TABLE
         
         # Check for code blocks
-        if re.search(r'```[\s\S]*?```', content):
+        if _RE_CODE_BLOCK.search(content):
             return ContentType.CODE_BLOCK
         
         # Check for lists
-        list_lines = len(re.findall(r'^[\s]*[-*+]\s', content, re.MULTILINE))
-        list_lines += len(re.findall(r'^[\s]*\d+\.\s', content, re.MULTILINE))
+        list_lines = len(_RE_BULLET_ITEM.findall(content))
+        list_lines += len(_RE_NUMBERED_ITEM.findall(content))
         total_lines = content.count('\n') + 1
         
         if total_lines > 0 and list_lines / total_lines > 0.5:
             return ContentType.LIST
         
         # Check if it's just a heading
-        if re.match(r'^#{1,6}\s+.+$', content.strip()) and '\n' not in content.strip():
+        if _RE_HEADING_ONLY.match(content.strip()) and '\n' not in content.strip():
             return ContentType.HEADING
         
         return ContentType.PROSE
@@ -1,19 +1,27 @@
 """TOC processor for extracting and enriching document structure."""
 
+import bisect
+import math
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 from ..processing.models import TOCItem, Section
 
+# Markdown heading (# Heading). Also imported by the segmenter and heading fixer
+_RE_HEADING = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
 
-@dataclass
+
+@dataclass(slots=True)
 class TOCNode:
     """A node in the hierarchical TOC tree."""
     item: TOCItem
     parent: Optional["TOCNode"] = None
     children: list["TOCNode"] = None
+    # Ancestor titles from the root, set by TOCProcessor when the tree is built
+    _path: tuple[str, ...] = field(default=(), repr=False, compare=False)
     
     def __post_init__(self):
         if self.children is None:
@@ -22,9 +30,10 @@ class TOCNode:
     @property
     def path(self) -> list[str]:
         """Get the full path from root to this node."""
-        if self.parent is None:
-            return []
-        return self.parent.path + [self.parent.item.title]
+        if self.parent is not None and not self._path:
+            # Node was linked by hand rather than by TOCProcessor
+            self._path = (*self.parent.path, self.parent.item.title)
+        return list(self._path)
 
 
 class TOCProcessor:
@@ -42,7 +51,31 @@ class TOCProcessor:
         """
         self.toc_items = toc_items
         self.root_nodes: list[TOCNode] = []
+        # All nodes in TOC (depth-first) order, filled by _build_tree
+        self._nodes: list[TOCNode] = []
         self._build_tree()
+        self._build_page_index()
+        # Built on first use by get_flat_sections / get_sibling_sections
+        self._flat_sections: Optional[list[dict]] = None
+        self._sibling_titles: Optional[list[str]] = None
+    
+    @classmethod
+    def validate(cls, toc_items: list[TOCItem]) -> bool:
+        """Check that TOC items can be processed, without building the tree.
+        
+        Args:
+            toc_items: Flat list of TOC items from PDF extraction.
+            
+        Returns:
+            True if every item has an integer level (any value, the tree
+            only compares levels), a string title and an integer page number.
+        """
+        return all(
+            isinstance(item.level, int)
+            and isinstance(item.title, str)
+            and isinstance(item.page_number, int)
+            for item in toc_items
+        )
     
     def _build_tree(self) -> None:
         """Build hierarchical tree from flat TOC list."""
@@ -51,23 +84,48 @@ class TOCProcessor:
         
         # Stack to track parent at each level
         stack: list[TOCNode] = []
+        # Title of each stack node as stored in its children's paths
+        stack_titles: list[str] = []
         
         for item in self.toc_items:
             node = TOCNode(item=item)
+            self._nodes.append(node)
             
             # Pop stack until we find the parent level
             while stack and stack[-1].item.level >= item.level:
                 stack.pop()
+                stack_titles.pop()
             
             if stack:
                 # This is a child of the top of stack
                 node.parent = stack[-1]
+                node._path = node.parent._path + (stack_titles[-1],)
                 stack[-1].children.append(node)
             else:
                 # This is a root node
                 self.root_nodes.append(node)
             
             stack.append(node)
+            # Titles are repeated in every descendant's path, so equal titles
+            # share one string there; the caller's items are left as they are
+            title = item.title
+            stack_titles.append(sys.intern(title) if type(title) is str else title)
+    
+    def _build_page_index(self) -> None:
+        """Index nodes by start page for binary search in get_section_at_page.
+        
+        The TOC list is already in depth-first order, so a stable sort by page
+        keeps a child after its parent when both start on the same page.
+        """
+        nodes = sorted(self._nodes, key=lambda node: node.item.page_number)
+        self._page_starts = [node.item.page_number for node in nodes]
+        self._nodes_by_start = nodes
+        # Index of the previous lookup result, see get_section_at_page
+        self._last_index = 0
+        # The binary search only finds the same section as a walk down the
+        # tree when the TOC lists sections in page order
+        pages = [node.item.page_number for node in self._nodes]
+        self._in_page_order = all(a <= b for a, b in zip(pages, pages[1:]))
     
     def get_section_at_page(self, page_number: int) -> Optional[TOCNode]:
         """Find the deepest section containing a page number.
@@ -78,22 +136,52 @@ class TOCProcessor:
         Returns:
             The most specific TOCNode containing this page, or None.
         """
-        def find_in_nodes(nodes: list[TOCNode], page: int) -> Optional[TOCNode]:
-            result = None
+        if not self._in_page_order:
+            return self._walk_to_section_at_page(page_number)
+        
+        # The last section starting on or before the page is the deepest one.
+        # Callers usually walk pages in ascending order, so start the search
+        # from the previous result when it is still at or before the page.
+        starts = self._page_starts
+        last = self._last_index
+        if last < len(starts) and starts[last] <= page_number:
+            if last + 1 == len(starts) or starts[last + 1] > page_number:
+                return self._nodes_by_start[last]
+            index = bisect.bisect_right(starts, page_number, last) - 1
+        else:
+            index = bisect.bisect_right(starts, page_number) - 1
+        
+        if index < 0:
+            return None
+        self._last_index = index
+        return self._nodes_by_start[index]
+    
+    def _walk_to_section_at_page(self, page_number: int) -> Optional[TOCNode]:
+        """Find the section containing a page by walking down the tree.
+        
+        Used by get_section_at_page for TOCs that are not in page order. At
+        each level the first section starting on or before the page whose
+        next sibling starts after it is taken, then its children are searched.
+        
+        Args:
+            page_number: The page number to look up.
+            
+        Returns:
+            The most specific TOCNode containing this page, or None.
+        """
+        result = None
+        nodes = self.root_nodes
+        while nodes:
             for i, node in enumerate(nodes):
-                if node.item.page_number <= page:
-                    # Check if next sibling starts after this page
-                    if i + 1 < len(nodes) and nodes[i + 1].item.page_number <= page:
-                        continue
-                    result = node
-                    # Check children for more specific match
-                    child_result = find_in_nodes(node.children, page)
-                    if child_result:
-                        result = child_result
+                if node.item.page_number > page_number:
+                    continue
+                if i + 1 == len(nodes) or nodes[i + 1].item.page_number > page_number:
                     break
-            return result
-        
-        return find_in_nodes(self.root_nodes, page_number)
+            else:
+                break
+            result = node
+            nodes = node.children
+        return result
     
     def get_section_path(self, page_number: int) -> list[str]:
         """Get the full section path for a page.
@@ -107,36 +195,71 @@ class TOCProcessor:
         node = self.get_section_at_page(page_number)
         if not node:
             return []
-        return node.path + [node.item.title]
+        return [*node._path, node.item.title]
     
     def get_flat_sections(self) -> list[dict]:
         """Get flat list of all sections with their paths.
         
         Returns:
-            List of dicts with section info including path.
+            List of dicts with section info including path. Each call returns
+            new dicts, so callers may modify them.
         """
-        sections = []
+        if self._flat_sections is None:
+            self._flat_sections = self._build_flat_sections()
+        # Copy the cached records so one caller's changes can't leak into another's
+        return [{**section, "path": list(section["path"])} for section in self._flat_sections]
+    
+    def _page_ends(self) -> list[Optional[int]]:
+        """Last page of each node in ``_nodes``, or None if it is open-ended.
         
-        def traverse(nodes: list[TOCNode], path: list[str]):
-            for i, node in enumerate(nodes):
-                # Determine page range
-                page_end = None
-                if i + 1 < len(nodes):
-                    page_end = nodes[i + 1].item.page_number - 1
-                
-                sections.append({
-                    "title": node.item.title,
-                    "level": node.item.level,
-                    "page_start": node.item.page_number,
-                    "page_end": page_end,
-                    "path": path.copy()
-                })
-                
-                traverse(node.children, path + [node.item.title])
-        
-        traverse(self.root_nodes, [])
+        A section ends the page before its next sibling starts.
+        """
+        page_ends: dict[int, int] = {}
+        for siblings in (self.root_nodes, *(node.children for node in self._nodes)):
+            for node, next_node in zip(siblings, siblings[1:]):
+                page_ends[id(node)] = next_node.item.page_number - 1
+        return [page_ends.get(id(node)) for node in self._nodes]
+    
+    def _build_flat_sections(self) -> list[dict]:
+        """Flatten the section tree in TOC order.
+        
+        Returns:
+            List of section dicts, see get_flat_sections.
+        """
+        # _nodes is already in depth-first order, so no tree walk is needed
+        sections = [
+            {
+                "title": node.item.title,
+                "level": node.item.level,
+                "page_start": node.item.page_number,
+                "page_end": page_end,
+                "path": node._path
+            }
+            for node, page_end in zip(self._nodes, self._page_ends())
+        ]
         return sections
     
+    def _build_sibling_index(self) -> None:
+        """Build the lookup arrays for get_sibling_sections.
+        
+        get_sibling_sections looks for the first section that either starts
+        after the page or still covers it. The first index where a running
+        maximum passes the page is the first index where the value itself
+        does, so both conditions can be found with a binary search.
+        """
+        self._sibling_titles = [node.item.title for node in self._nodes]
+        self._sibling_starts = [node.item.page_number for node in self._nodes]
+        self._max_starts: list[int] = []
+        self._max_ends: list[float] = []
+        max_start = -math.inf
+        max_end = -math.inf
+        for page_start, page_end in zip(self._sibling_starts, self._page_ends()):
+            max_start = max(max_start, page_start)
+            # An open-ended section covers every later page
+            max_end = max(max_end, math.inf if page_end is None else page_end)
+            self._max_starts.append(max_start)
+            self._max_ends.append(max_end)
+    
     def get_sibling_sections(self, page_number: int) -> tuple[Optional[str], Optional[str]]:
         """Get preceding and following section titles for a page.
         
@@ -146,24 +269,25 @@ class TOCProcessor:
         Returns:
             Tuple of (preceding_section, following_section) titles.
         """
-        flat = self.get_flat_sections()
-        preceding = None
+        if self._sibling_titles is None:
+            self._build_sibling_index()
+        titles = self._sibling_titles
+        
+        # Every section before index i ends before the page
+        i = min(
+            bisect.bisect_right(self._max_starts, page_number),
+            bisect.bisect_left(self._max_ends, page_number)
+        )
+        preceding = titles[i - 1] if i > 0 else None
         following = None
         
-        for i, section in enumerate(flat):
-            if section["page_start"] <= page_number:
-                if section["page_end"] is None or section["page_end"] >= page_number:
-                    # Current section
-                    if i > 0:
-                        preceding = flat[i - 1]["title"]
-                    if i + 1 < len(flat):
-                        following = flat[i + 1]["title"]
-                    break
-                else:
-                    preceding = section["title"]
+        if i < len(titles):
+            if self._sibling_starts[i] <= page_number:
+                # Current section
+                if i + 1 < len(titles):
+                    following = titles[i + 1]
             else:
-                following = section["title"]
-                break
+                following = titles[i]
         
         return preceding, following
 
@@ -180,11 +304,9 @@ def infer_toc_from_markdown(markdown: str) -> list[TOCItem]:
     toc_items = []
     
     # Match markdown headings (# Heading)
-    heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
-    
-    for match in heading_pattern.finditer(markdown):
+    for match in _RE_HEADING.finditer(markdown):
         level = len(match.group(1))
-        title = match.group(2).strip()
+        title = sys.intern(match.group(2).strip())
         
         # We can't reliably determine page numbers from markdown
         # Use position as proxy (this is a limitation)
@@ -8,6 +8,10 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Three or more newlines, possibly with blank-line whitespace in between.
+# Also imported by the cleanup and metadata passes
+_RE_BLANK_RUN = re.compile(r'\n(?:[ \t]*+\n){2,}+')
+
 
 @dataclass
 class WhitespaceConfig:
@@ -44,7 +48,7 @@ class WhitespaceNormalizer:
         # Replace 3+ newlines with 2 newlines
         # This collapses any sequence of 3 or more \n characters (possibly with whitespace between them)
         # into exactly two \n characters.
-        result = re.sub(r'\n([ \t]*\n){2,}', '\n\n', result)
+        result = _RE_BLANK_RUN.sub('\n\n', result)
         
         # Ensure single newline at end
         result = result.rstrip() + '\n'
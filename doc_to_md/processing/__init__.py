@@ -10,11 +10,13 @@ from .models import (
     TableData,
     TOCItem,
 )
+from .pdfium_converter import PdfiumConverter
 from .pymupdf_converter import PyMuPDFConverter
 
 __all__ = [
     "PDFConverterBase",
     "PyMuPDFConverter",
+    "PdfiumConverter",
     "ConversionResult",
     "DocumentMetadata",
     "TOCItem",
@@ -1,12 +1,20 @@
 """Data models for PDF to Markdown conversion."""
 
+import functools
+import json
+import re
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, TextIO, Union
 
+try:
+    import orjson as _orjson
+except ImportError:  # orjson is optional, fall back to the json module
+    _orjson = None
 
-class ContentType(Enum):
+
+class ContentType(StrEnum):
     """Type of content in a chunk."""
     PROSE = "prose"
     TABLE = "table"
@@ -16,7 +24,7 @@ class ContentType(Enum):
     MIXED = "mixed"
 
 
-@dataclass
+@dataclass(slots=True)
 class TOCItem:
     """Represents an item in the Table of Contents."""
     level: int
@@ -31,7 +39,12 @@ class TOCItem:
         }
 
 
-@dataclass
+# A markdown table as stored in TableData.content: header row, separator row,
+# then any body rows. Shared by the converters and the segmenter
+_RE_TABLE = re.compile(r'(\|[^\n]+\|\n\|[-:\| ]+\|\n(?:\|[^\n]+\|\n)*)', re.MULTILINE)
+
+
+@dataclass(slots=True)
 class TableData:
     """Represents an extracted table."""
     content: str  # Markdown formatted table
@@ -50,7 +63,7 @@ class TableData:
         }
 
 
-@dataclass 
+@dataclass(slots=True)
 class DocumentMetadata:
     """Metadata extracted from the PDF document."""
     title: Optional[str] = None
@@ -73,7 +86,7 @@ class DocumentMetadata:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Represents a document section with hierarchy."""
     title: str
@@ -90,7 +103,8 @@ class Section:
         """Get the full section path as string."""
         return " > ".join(self.path + [self.title])
     
-    def to_dict(self) -> dict:
+    def _shallow_dict(self) -> dict:
+        """Fields of this section for ``to_dict``, with subsections left as models."""
         return {
             "title": self.title,
             "level": self.level,
@@ -99,12 +113,60 @@ class Section:
             "page_end": self.page_end,
             "path": self.path,
             "full_path": self.full_path,
-            "content_types": [ct.value for ct in self.content_types],
-            "subsections": [s.to_dict() for s in self.subsections]
+            "content_types": [str(ct) for ct in self.content_types],
+            "subsections": self.subsections
         }
+    
+    def to_dict(self) -> dict:
+        # Collect the subtree with an explicit stack, then build the dicts
+        # bottom-up (children first) instead of recursing per subsection
+        order = []
+        stack = [self]
+        while stack:
+            section = stack.pop()
+            order.append(section)
+            stack.extend(section.subsections)
+        
+        dicts: dict[int, dict] = {}
+        for section in reversed(order):
+            data = section._shallow_dict()
+            data["subsections"] = [dicts[id(s)] for s in section.subsections]
+            dicts[id(section)] = data
+        return dicts[id(self)]
+
 
+@functools.lru_cache(maxsize=4096)
+def _section_frontmatter(
+    section_path: tuple[str, ...],
+    section_level: int,
+    preceding_section: Optional[str],
+    following_section: Optional[str]
+) -> tuple[str, str]:
+    """Format the section-dependent frontmatter lines of a chunk.
+    
+    Args:
+        section_path: Section titles from the root.
+        section_level: Heading level of the section.
+        preceding_section: Title of the preceding section, if any.
+        following_section: Title of the following section, if any.
+        
+    Returns:
+        Tuple of (path and level lines, neighbor lines), each ending in a newline.
+    """
+    # Formatted as a list to match the section_path field
+    section_lines = f"section_path: {list(section_path)}\nsection_level: {section_level}\n"
+    neighbor_lines = "".join(
+        f"{key}: \"{title}\"\n"
+        for key, title in (
+            ("preceding_section", preceding_section),
+            ("following_section", following_section)
+        )
+        if title
+    )
+    return section_lines, neighbor_lines
 
-@dataclass
+
+@dataclass(slots=True)
 class Chunk:
     """A content chunk optimized for RAG retrieval."""
     content: str
@@ -120,20 +182,23 @@ class Chunk:
     
     def to_frontmatter(self) -> str:
         """Generate YAML frontmatter for markdown output."""
-        lines = ["---"]
-        lines.append(f"section_path: {self.section_path}")
-        lines.append(f"section_level: {self.section_level}")
-        lines.append(f"page_number: {self.page_number}")
-        lines.append(f"content_type: {self.content_type.value}")
-        if self.preceding_section:
-            lines.append(f"preceding_section: \"{self.preceding_section}\"")
-        if self.following_section:
-            lines.append(f"following_section: \"{self.following_section}\"")
-        lines.append(f"has_tables: {str(self.has_tables).lower()}")
-        lines.append(f"has_code_blocks: {str(self.has_code_blocks).lower()}")
-        lines.append(f"chunk_index: {self.chunk_index}")
-        lines.append("---")
-        return "\n".join(lines)
+        # Chunks of the same section share these lines, see _section_frontmatter
+        section_lines, neighbor_lines = _section_frontmatter(
+            tuple(self.section_path),
+            self.section_level,
+            self.preceding_section,
+            self.following_section
+        )
+        return (
+            f"---\n{section_lines}"
+            f"page_number: {self.page_number}\n"
+            f"content_type: {self.content_type}\n"
+            f"{neighbor_lines}"
+            f"has_tables: {'true' if self.has_tables else 'false'}\n"
+            f"has_code_blocks: {'true' if self.has_code_blocks else 'false'}\n"
+            f"chunk_index: {self.chunk_index}\n"
+            "---"
+        )
     
     def to_markdown(self) -> str:
         """Generate full markdown with frontmatter."""
@@ -145,7 +210,7 @@ class Chunk:
             "section_path": self.section_path,
             "section_level": self.section_level,
             "page_number": self.page_number,
-            "content_type": self.content_type.value,
+            "content_type": str(self.content_type),
             "preceding_section": self.preceding_section,
             "following_section": self.following_section,
             "has_tables": self.has_tables,
@@ -154,7 +219,7 @@ class Chunk:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionResult:
     """Result of PDF to Markdown conversion."""
     markdown: str
@@ -164,12 +229,69 @@ class ConversionResult:
     sections: list[Section] = field(default_factory=list)
     chunks: list[Chunk] = field(default_factory=list)
     
-    def to_dict(self) -> dict:
+    def _shallow_dict(self) -> dict:
+        """Fields of this result for ``to_dict``, with nested models left as models."""
         return {
             "markdown": self.markdown,
-            "toc": [t.to_dict() for t in self.toc],
-            "tables": [t.to_dict() for t in self.tables],
-            "metadata": self.metadata.to_dict(),
-            "sections": [s.to_dict() for s in self.sections],
-            "chunks": [c.to_dict() for c in self.chunks]
+            "toc": self.toc,
+            "tables": self.tables,
+            "metadata": self.metadata,
+            "sections": self.sections,
+            "chunks": self.chunks
         }
+    
+    def to_dict(self) -> dict:
+        return {
+            key: [item.to_dict() for item in value] if isinstance(value, list)
+            else value.to_dict() if hasattr(value, "to_dict")
+            else value
+            for key, value in self._shallow_dict().items()
+        }
+    
+    def to_json(self, fp: TextIO, **kwargs: Any) -> None:
+        """Write the result as JSON to a file object.
+        
+        Produces the same document as ``json.dump(self.to_dict(), fp)``, but
+        nested models are converted one at a time while encoding instead of
+        building the whole nested dict first.
+        
+        Args:
+            fp: Text file object to write to.
+            **kwargs: Extra arguments for ``json.dump`` (e.g. ``indent``).
+        """
+        json.dump(self, fp, default=_json_default, **kwargs)
+    
+    def write_json(self, path: Union[str, Path]) -> None:
+        """Write the result to a file as indented UTF-8 JSON.
+        
+        Uses orjson's C encoder when it is installed and otherwise streams
+        through ``to_json``; both produce the same document.
+        
+        Args:
+            path: Destination file.
+        """
+        if _orjson is not None:
+            data = _orjson.dumps(
+                self,
+                default=_json_default,
+                option=_orjson.OPT_INDENT_2 | _orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+            with open(path, 'wb') as f:
+                f.write(data)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                self.to_json(f, indent=2, ensure_ascii=False)
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert a model to JSON-encodable data, one level at a time.
+    
+    Used as the ``default`` hook in ``ConversionResult.to_json``; nested
+    models are left in place and converted when the encoder reaches them.
+    """
+    if isinstance(obj, (ConversionResult, Section)):
+        # Same fields as to_dict, nested models are converted later
+        return obj._shallow_dict()
+    if isinstance(obj, (TOCItem, TableData, DocumentMetadata, Chunk)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
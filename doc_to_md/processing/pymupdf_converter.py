@@ -1,22 +1,31 @@
 """PDF converter implementation using pymupdf4llm."""
 
-import re
 from pathlib import Path
 from typing import Union
 
-import pymupdf.layout
-import pymupdf
-import pymupdf4llm
-
 from .converter_interface import PDFConverterBase
 from .models import (
     ConversionResult,
     DocumentMetadata,
     TableData,
     TOCItem,
+    _RE_TABLE,
 )
 
 
+def _load_pymupdf():
+    """Import pymupdf and pymupdf4llm on first use.
+    
+    Loading them, layout models included, takes about half a second, which
+    the CLI help, the pdfium backend and the post-processors never need.
+    """
+    # pymupdf.layout must be imported before pymupdf4llm to enable it
+    import pymupdf.layout  # noqa: F401
+    import pymupdf
+    import pymupdf4llm
+    return pymupdf, pymupdf4llm
+
+
 class PyMuPDFConverter(PDFConverterBase):
     """PDF to Markdown converter using pymupdf4llm.
     
@@ -24,6 +33,10 @@ class PyMuPDFConverter(PDFConverterBase):
     for high-quality markdown conversion with TOC and table support.
     """
     
+    def __init__(self):
+        # The backend is imported with the first converter, not with the package
+        self._pymupdf, self._pymupdf4llm = _load_pymupdf()
+    
     @property
     def name(self) -> str:
         return "pymupdf4llm"
@@ -40,7 +53,7 @@ class PyMuPDFConverter(PDFConverterBase):
         path = Path(pdf_path)
         
         # Extract markdown with page chunks for metadata
-        md_text = pymupdf4llm.to_markdown(
+        md_text = self._pymupdf4llm.to_markdown(
             str(path),
             page_chunks=False,  # Get full document first
             write_images=False,  # Don't extract images for now
@@ -75,7 +88,7 @@ class PyMuPDFConverter(PDFConverterBase):
             List of TOCItem with level, title, and page number.
         """
         path = Path(pdf_path)
-        doc = pymupdf.open(str(path))
+        doc = self._pymupdf.open(str(path))
         
         try:
             raw_toc = doc.get_toc()
@@ -103,7 +116,7 @@ class PyMuPDFConverter(PDFConverterBase):
             DocumentMetadata with available information.
         """
         path = Path(pdf_path)
-        doc = pymupdf.open(str(path))
+        doc = self._pymupdf.open(str(path))
         
         try:
             meta = doc.metadata or {}
@@ -133,27 +146,22 @@ class PyMuPDFConverter(PDFConverterBase):
         """
         tables = []
         
-        # Regex pattern to match markdown tables
-        # A table starts with a header row, then a separator row with dashes/pipes
-        table_pattern = re.compile(
-            r'(\|[^\n]+\|\n\|[-:\| ]+\|\n(?:\|[^\n]+\|\n)*)',
-            re.MULTILINE
-        )
-        
-        for match in table_pattern.finditer(markdown):
+        for match in _RE_TABLE.finditer(markdown):
             table_content = match.group(1).strip()
-            rows = table_content.split('\n')
             
-            # Count columns from header row
-            if rows:
-                col_count = len([c for c in rows[0].split('|') if c.strip()])
-                row_count = len(rows) - 1  # Exclude separator row
-                
-                tables.append(TableData(
-                    content=table_content,
-                    page_number=0,  # Would need page tracking for accuracy
-                    row_count=row_count,
-                    col_count=col_count
-                ))
+            # The pattern guarantees a header row followed by a separator row,
+            # so rows can be measured in place instead of splitting the table
+            header_row = table_content[:table_content.find('\n')]
+            
+            # Count columns from header row, which is framed by pipes on both sides
+            col_count = header_row.count('|') - 1
+            row_count = table_content.count('\n')  # Rows minus the separator row
+            
+            tables.append(TableData(
+                content=table_content,
+                page_number=0,  # Would need page tracking for accuracy
+                row_count=row_count,
+                col_count=col_count
+            ))
         
         return tables
@@ -1,6 +1,8 @@
 import pytest
 from doc_to_md.post_processing.markdown_cleanup import MarkdownCleanup, CleanupConfig
 from doc_to_md.post_processing.whitespace_normalizer import WhitespaceNormalizer, WhitespaceConfig
+from doc_to_md.post_processing.code_block_fixer import CodeBlockFixer
+from doc_to_md.post_processing.link_fixer import LinkFixer
 
 def test_dot_leader_removal():
     cleanup = MarkdownCleanup(CleanupConfig(remove_redundant_toc=True))
@@ -47,6 +49,31 @@ def test_footer_removal():
     result = cleanup.clean(input_text)
     assert "**45**" not in result.split('\n')
 
+def test_dot_line_removal_takes_surrounding_blank_lines():
+    cleanup = MarkdownCleanup(CleanupConfig())
+    assert cleanup.clean("# Head\n**Chapter 3** **7**\n......\n```") == "# Head\n\n```\n"
+    assert cleanup.clean("a\n\n......\n\n........\nb") == "a\n\nb\n"
+
+def test_footer_removal_takes_surrounding_blank_lines():
+    cleanup = MarkdownCleanup(CleanupConfig())
+
+    assert cleanup.clean("tence\n\n**Contents** **5**\nnext") == "tence\n\nnext\n"
+    assert cleanup.clean("a\n\n**Contents** **5**\n\n**7**\n\n42\n\nb") == "a\n\n\nb\n"
+
+    # Footers split across lines are no longer matched as a whole
+    assert cleanup.clean("x\n**Contents**\n**5**\ny") == "x\n**Contents**\n\ny\n"
+    assert cleanup.clean("---\n**23**\n** **\n___ ") == "---\n** **\n---\n"
+
+def test_line_passes_combined():
+    cleanup = MarkdownCleanup(CleanupConfig())
+    
+    input_text = "A broken sen-\n**12** **Contents**\ntence ends here.   \n***\n\n\n****Note****\n42"
+    result = cleanup.clean(input_text)
+    assert result == "A broken sen-\n\ntence ends here.\n---\n**Note**\n"
+    
+    # Word breaks are joined with the next line
+    assert cleanup.clean("A broken sen-\ntence").strip() == "A broken sentence"
+
 def test_bullet_normalization():
     cleanup = MarkdownCleanup(CleanupConfig()) # Bullet normalization is on by default in clean() if implemented
     
@@ -69,3 +96,36 @@ def test_whitespace_normalization():
     # Test preserving 2 newlines
     input_text = "Line 1\n\nLine 2"
     assert normalizer.normalize(input_text).strip() == "Line 1\n\nLine 2"
+
+def test_code_detection_keeps_order_around_fences():
+    fixer = CodeBlockFixer()
+    md = "import os\n```\nprint(1)\n```\nimport sys"
+    result = fixer._detect_and_wrap_code_blocks(md)
+    assert result == md
+
+def test_broken_url_chain_joined():
+    fixer = LinkFixer()
+    
+    # The joined continuation opens another broken link on the same line
+    md = "See [a](http://x.\ncom) and [b](http://y.\ncom/p) here\nNext"
+    assert fixer.fix_links(md) == "See [a](http://x.com) and [b](http://y.com/p) here\nNext"
+
+def test_collapse_blank_lines_matches_whitespace_pass():
+    md = "Title\n\n\n\nText \n \n\t\n\nMore\n\n\n"
+    separate = WhitespaceNormalizer().normalize(MarkdownCleanup().clean(md))
+    fused = MarkdownCleanup(CleanupConfig(collapse_blank_lines=True)).clean(md)
+    assert fused == separate == "Title\n\nText\n\nMore\n"
+
+def test_collapse_blank_lines_matches_whitespace_pass_around_artifacts():
+    # Expected outputs of the original clean() followed by WhitespaceNormalizer
+    cases = {
+        "Intro\n\n**Contents** **5**\n\n\n**12** **Managing logs**\nBody": "Intro\n\nBody\n",
+        "Text\n\n\n**7**\n \n42\n\nMore": "Text\n\nMore\n",
+        "Rule\n***\n\n\n___ \nAfter\n\n\n\nEnd": "Rule\n---\n---\nAfter\n\nEnd\n",
+        "# Head\n**Chapter 3** **7**\n......\n\n\n```\ncode\n```": "# Head\n\n```\ncode\n```\n",
+        "Title 1..... 10 Title 2..... 11\n\n\n.........\n\nText": "Text\n",
+    }
+    for md, expected in cases.items():
+        separate = WhitespaceNormalizer().normalize(MarkdownCleanup().clean(md))
+        fused = MarkdownCleanup(CleanupConfig(collapse_blank_lines=True)).clean(md)
+        assert fused == separate == expected
@@ -39,3 +39,46 @@ def test_heading_level_fix():
     
     # Should move from ## to ### based on TOC level
     assert fixer.fix_headings("## Deep Section").strip() == "### Deep Section"
+
+def test_fix_headings_collect_stats():
+    toc = [
+        TOCItem(level=1, title="1 Overview", page_number=1),
+        TOCItem(level=2, title="Background", page_number=2),
+    ]
+    fixer = HeadingFixer(toc, HeadingFixerConfig())
+    markdown = "## 1\n\n## Overview\n\nText\n\n# Background\n\n### Figure 1: Test"
+    
+    fixed, stats = fixer.fix_headings(markdown, collect_stats=True)
+    
+    assert fixed == fixer.fix_headings(markdown)
+    # The split heading is counted once, after merging
+    assert stats["total_headings"] == 3
+    assert stats["matched_to_toc"] == 2
+    assert stats["level_corrections"] == 2
+    assert stats["unmatched"] == ["Figure 1: Test"]
+    # The raw input still has four headings
+    assert fixer.get_heading_statistics(markdown)["total_headings"] == 4
+
+def test_fuzzy_match_same_with_and_without_rapidfuzz(monkeypatch):
+    pytest.importorskip("rapidfuzz")
+    from doc_to_md.post_processing import heading_fixer
+    
+    toc = [
+        TOCItem(level=2, title="Overview to overview", page_number=1),
+        TOCItem(level=3, title="Installing the air shroud", page_number=2),
+    ]
+    headings = [
+        # difflib ratio 0.55, rapidfuzz ratio 0.85: must not match
+        "Overview overview to",
+        "Installing the air shrouds",
+        "Removing the air shroud",
+    ]
+    
+    fast = HeadingFixer(toc)
+    fast_levels = [fast._find_toc_level(h) for h in headings]
+    monkeypatch.setattr(heading_fixer, "_rf_fuzz", None)
+    slow = HeadingFixer(toc)
+    slow_levels = [slow._find_toc_level(h) for h in headings]
+    
+    assert fast_levels == slow_levels
+    assert fast_levels[:2] == [None, 3]
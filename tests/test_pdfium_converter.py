@@ -0,0 +1,44 @@
+import pytest
+from doc_to_md.processing import PdfiumConverter
+
+pytest.importorskip("pypdfium2")
+
+
+def _make_pdf(path, pages):
+    """Write a minimal PDF with one Helvetica text line per list item."""
+    font_id = 3 + 2 * len(pages)
+    kids = ' '.join(f'{3 + 2 * i} 0 R' for i in range(len(pages)))
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        f'<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>',
+    ]
+    for i, lines in enumerate(pages):
+        content = 'BT /F1 12 Tf 72 720 Td 14 TL ' + ' '.join(f'({line}) Tj T*' for line in lines) + ' ET'
+        objects.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            f'/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>'
+        )
+        objects.append(f'<< /Length {len(content)} >>\nstream\n{content}\nendstream')
+    objects.append('<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+    
+    data = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1')
+    xref = len(data)
+    data += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+    data += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode('latin-1')
+    data += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode('latin-1')
+    path.write_bytes(data)
+
+
+def test_convert_joins_pages_and_hyphenated_words(tmp_path):
+    pdf_path = tmp_path / "doc.pdf"
+    _make_pdf(pdf_path, [["A long hyphen-", "ated word."], ["Second page"]])
+    
+    result = PdfiumConverter().convert(pdf_path)
+    
+    assert result.markdown == "A long hyphenated word.\n\nSecond page"
+    assert result.metadata.page_count == 2
+    assert result.toc == []
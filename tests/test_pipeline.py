@@ -1,4 +1,5 @@
 import pytest
+import time
 from unittest.mock import MagicMock, patch
 from pathlib import Path
 from doc_to_md.pipeline import DocToMd, PipelineConfig
@@ -56,3 +57,173 @@ def test_run_method(mock_convert, tmp_path):
     # Verify file was written
     assert output_file.exists()
     assert output_file.read_text(encoding='utf-8') == "Processed content"
+
+def test_result_to_json_matches_to_dict():
+    import io
+    import json
+    from doc_to_md.processing.models import Chunk, ContentType, Section
+    
+    child = Section(title="Child", level=2, content="b", page_start=2, page_end=2, path=["Root"])
+    root = Section(title="Root", level=1, content="a", page_start=1, page_end=2, subsections=[child])
+    result = ConversionResult(
+        markdown="# Root",
+        toc=[TOCItem(level=1, title="Root", page_number=1)],
+        metadata=DocumentMetadata(title="Doc"),
+        sections=[root],
+        chunks=[Chunk(content="a", section_path=["Root"], section_level=1, page_number=1, content_type=ContentType.PROSE)]
+    )
+    
+    buffer = io.StringIO()
+    result.to_json(buffer, indent=2)
+    assert buffer.getvalue() == json.dumps(result.to_dict(), indent=2)
+
+@patch("doc_to_md.pipeline.PyMuPDFConverter")
+def test_cache_dir_skips_conversion(mock_converter_class, tmp_path):
+    mock_converter = mock_converter_class.return_value
+    mock_converter.convert.side_effect = lambda path: ConversionResult(
+        markdown="# Test\n\n\n\nBody",
+        metadata=DocumentMetadata(title="Test Doc")
+    )
+    pdf_path = tmp_path / "doc.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 dummy")
+    cache_dir = tmp_path / "cache"
+    
+    first = DocToMd(segment_content=False, cache_dir=cache_dir).convert(pdf_path)
+    second = DocToMd(segment_content=False, cache_dir=cache_dir).convert(pdf_path)
+    assert second.markdown == first.markdown
+    assert mock_converter.convert.call_count == 1
+    
+    # Post-processing changes reuse the cached conversion but rerun the stages
+    raw = DocToMd(segment_content=False, run_cleanup=False, run_whitespace_norm=False,
+                  cache_dir=cache_dir).convert(pdf_path)
+    assert raw.markdown == "# Test\n\n\n\nBody"
+    assert mock_converter.convert.call_count == 1
+
+def test_write_json_matches_to_dict(tmp_path):
+    import json
+    from doc_to_md.processing.models import Section
+    
+    child = Section(title="Child", level=2, content="é", page_start=2, page_end=2, path=["Root"])
+    root = Section(title="Root", level=1, content="a", page_start=1, page_end=2, subsections=[child])
+    result = ConversionResult(markdown="# Root", sections=[root])
+    
+    output_file = tmp_path / "result.json"
+    result.write_json(output_file)
+    expected = json.dumps(result.to_dict(), indent=2, ensure_ascii=False)
+    assert output_file.read_text(encoding='utf-8') == expected
+
+def test_find_inputs(tmp_path):
+    from doc_to_md.pipeline import find_inputs
+    
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "dir.pdf").mkdir()
+    for name in ("b.pdf", "A.PDF", "notes.txt", "sub/c.pdf"):
+        (tmp_path / name).write_bytes(b"%PDF")
+    
+    assert [p.name for p, _ in find_inputs(tmp_path)] == ["A.PDF", "b.pdf"]
+    found = find_inputs(tmp_path, recursive=True)
+    assert [p.relative_to(tmp_path).as_posix() for p, _ in found] == ["A.PDF", "b.pdf", "sub/c.pdf"]
+    assert {size for _, size in found} == {4}
+
+@patch("doc_to_md.pipeline.PyMuPDFConverter")
+def test_convert_directory_reports_each_file(mock_converter_class, tmp_path):
+    def convert(path):
+        if path.name == "bad.pdf":
+            raise ValueError("broken")
+        return ConversionResult(markdown=f"# {path.stem}")
+    mock_converter_class.return_value.convert.side_effect = convert
+    
+    input_dir = tmp_path / "in"
+    (input_dir / "sub").mkdir(parents=True)
+    for name in ("a.pdf", "bad.pdf", "sub/c.pdf"):
+        (input_dir / name).write_bytes(b"%PDF")
+    
+    reported = []
+    outputs = DocToMd(segment_content=False).convert_directory(
+        input_dir, tmp_path / "out", recursive=True,
+        on_file_done=lambda path, error: reported.append((path.name, str(error) if error else None))
+    )
+    
+    assert outputs == [tmp_path / "out" / "a", tmp_path / "out" / "sub" / "c"]
+    assert (tmp_path / "out" / "sub" / "c").read_text(encoding='utf-8').strip() == "# c"
+    assert reported == [("a.pdf", None), ("bad.pdf", "broken"), ("c.pdf", None)]
+
+@patch("doc_to_md.pipeline.PyMuPDFConverter")
+def test_convert_directory_reports_each_write_when_done(mock_converter_class, tmp_path):
+    events = []
+    def convert(path):
+        # Give the writer thread time to report the previous file
+        deadline = time.monotonic() + 1
+        while events and events[-1][0] == "convert" and time.monotonic() < deadline:
+            time.sleep(0.001)
+        events.append(("convert", path.name))
+        return ConversionResult(markdown=path.stem)
+    mock_converter_class.return_value.convert.side_effect = convert
+    
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    for name in ("a.pdf", "b.pdf", "skipped.pdf"):
+        (input_dir / name).write_bytes(b"%PDF")
+    
+    # Already listed inputs are used as given
+    DocToMd(segment_content=False).convert_directory(
+        input_dir, tmp_path / "out",
+        inputs=[(input_dir / "a.pdf", 4), (input_dir / "b.pdf", 4)],
+        on_file_done=lambda path, error: events.append(("done", path.name))
+    )
+    
+    assert events == [("convert", "a.pdf"), ("done", "a.pdf"), ("convert", "b.pdf"), ("done", "b.pdf")]
+
+@patch("doc_to_md.pipeline.PyMuPDFConverter")
+def test_level_zero_toc_is_kept(mock_converter_class):
+    toc = [
+        TOCItem(level=0, title="Front Matter", page_number=1),
+        TOCItem(level=1, title="Intro", page_number=1),
+    ]
+    mock_converter_class.return_value.convert.return_value = ConversionResult(
+        markdown="## Intro\n\nBody", toc=toc
+    )
+    
+    result = DocToMd().convert("dummy.pdf")
+    
+    assert result.toc == toc
+    assert result.markdown.startswith("# Intro")
+    assert result.chunks[0].section_path == ["Intro"]
+
+@patch("doc_to_md.pipeline.PyMuPDFConverter")
+def test_config_changes_after_init_are_used(mock_converter_class):
+    mock_converter_class.return_value.convert.side_effect = lambda path: ConversionResult(
+        markdown="Text\n\n42\n\nMore"
+    )
+    pipe = DocToMd(segment_content=False, enrich_metadata=False)
+    assert pipe.convert("dummy.pdf").markdown == "Text\n\nMore\n"
+    
+    pipe.config.cleanup_config.remove_orphan_page_numbers = False
+    assert pipe.convert("dummy.pdf").markdown == "Text\n\n42\n\nMore\n"
+
+@patch("doc_to_md.pipeline.PyMuPDFConverter")
+def test_cache_entries_from_another_version_are_ignored(mock_converter_class, tmp_path):
+    mock_converter = mock_converter_class.return_value
+    mock_converter.convert.side_effect = lambda path: ConversionResult(markdown="Body")
+    pdf_path = tmp_path / "doc.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 dummy")
+    cache_dir = tmp_path / "cache"
+    
+    DocToMd(segment_content=False, cache_dir=cache_dir).convert(pdf_path)
+    with patch("doc_to_md.pipeline.__version__", "0.0.0-old"):
+        DocToMd(segment_content=False, cache_dir=cache_dir).convert(pdf_path)
+    assert mock_converter.convert.call_count == 2
+
+@patch("doc_to_md.pipeline.PyMuPDFConverter")
+def test_failed_cache_store_is_skipped(mock_converter_class, tmp_path):
+    mock_converter_class.return_value.convert.side_effect = lambda path: ConversionResult(
+        markdown="Body"
+    )
+    pdf_path = tmp_path / "doc.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 dummy")
+    cache_dir = tmp_path / "cache"
+    
+    with patch("doc_to_md.pipeline.pickle.dump", side_effect=OSError("disk full")):
+        result = DocToMd(segment_content=False, cache_dir=cache_dir).convert(pdf_path)
+    assert result.markdown == "Body\n"
+    assert list(cache_dir.iterdir()) == []
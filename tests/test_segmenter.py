@@ -0,0 +1,22 @@
+import pytest
+from doc_to_md.post_processing.segmenter import SegmenterConfig, StructureAwareSegmenter
+
+def test_size_unit_bytes():
+    # 40 characters but 80 UTF-8 bytes per paragraph
+    para = "é" * 40
+    markdown = "# Title\n\n" + "\n\n".join([para] * 4)
+    
+    by_chars = StructureAwareSegmenter(config=SegmenterConfig(
+        target_chunk_size=100, max_chunk_size=200
+    ))
+    by_bytes = StructureAwareSegmenter(config=SegmenterConfig(
+        target_chunk_size=100, max_chunk_size=200, size_unit="bytes"
+    ))
+    
+    assert len(by_chars.segment(markdown)) == 1
+    chunks = by_bytes.segment(markdown)
+    assert len(chunks) > 1
+    assert "".join(c.content for c in chunks).count("é") == 160
+    
+    with pytest.raises(ValueError):
+        StructureAwareSegmenter(config=SegmenterConfig(size_unit="tokens"))
@@ -0,0 +1,75 @@
+import pytest
+from doc_to_md.post_processing.toc_processor import TOCProcessor
+from doc_to_md.processing.models import TOCItem
+
+def make_toc():
+    return [
+        TOCItem(level=1, title="Intro", page_number=1),
+        TOCItem(level=1, title="Setup", page_number=3),
+        TOCItem(level=2, title="Install", page_number=3),
+        TOCItem(level=2, title="Configure", page_number=5),
+        TOCItem(level=1, title="Usage", page_number=8),
+    ]
+
+def test_section_at_page():
+    processor = TOCProcessor(make_toc())
+    
+    assert processor.get_section_at_page(0) is None
+    assert processor.get_section_at_page(2).item.title == "Intro"
+    
+    # A child starting on its parent's page is the deeper match
+    assert processor.get_section_at_page(3).item.title == "Install"
+    assert processor.get_section_at_page(6).item.title == "Configure"
+    assert processor.get_section_at_page(99).item.title == "Usage"
+    
+    assert processor.get_section_path(4) == ["Setup", "Install"]
+
+def test_section_at_page_out_of_page_order():
+    # An outline listing sections out of page order is walked like a tree,
+    # not searched by page
+    processor = TOCProcessor([
+        TOCItem(level=1, title="Intro", page_number=1),
+        TOCItem(level=1, title="Usage", page_number=12),
+        TOCItem(level=2, title="Table 2 data", page_number=14),
+        TOCItem(level=2, title="Examples", page_number=13),
+        TOCItem(level=1, title="Appendix", page_number=3),
+    ])
+    
+    assert processor.get_section_path(3) == ["Intro"]
+    assert processor.get_section_path(13) == ["Appendix"]
+    assert processor.get_section_at_page(0) is None
+
+def test_sibling_sections():
+    processor = TOCProcessor(make_toc())
+    
+    assert processor.get_sibling_sections(0) == (None, "Intro")
+    assert processor.get_sibling_sections(1) == (None, "Setup")
+    
+    # Callers get their own copy of the cached flat list
+    sections = processor.get_flat_sections()
+    assert sections[2]["path"] == ["Setup"]
+    sections[2]["path"].append("Changed")
+    sections.clear()
+    assert processor.get_flat_sections()[2]["path"] == ["Setup"]
+
+def test_validate():
+    assert TOCProcessor.validate(make_toc())
+    assert TOCProcessor.validate([])
+    # Level 0 entries are valid, the tree only compares levels
+    assert TOCProcessor.validate([TOCItem(level=0, title="Intro", page_number=1)])
+    assert not TOCProcessor.validate([TOCItem(level=None, title="Intro", page_number=1)])
+    assert not TOCProcessor.validate([TOCItem(level=1, title=None, page_number=1)])
+
+def test_caller_items_not_modified():
+    title = "".join(["Set", "up"])
+    toc = [
+        TOCItem(level=1, title=title, page_number=1),
+        TOCItem(level=2, title="Install", page_number=2),
+        TOCItem(level=1, title=None, page_number=3),
+        TOCItem(level=2, title="Orphan", page_number=4),
+    ]
+    processor = TOCProcessor(toc)
+    
+    assert toc[0].title is title
+    assert processor.get_section_path(2) == ["Setup", "Install"]
+    assert processor.get_section_path(4) == [None, "Orphan"]